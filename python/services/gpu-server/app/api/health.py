@@ -7,6 +7,7 @@ from typing import Dict, Any
 from datetime import datetime
 
 from app.core.config import settings
+from app.core.manager.docker_manager import docker_manager
 from app.core.manager.gpu_manager import gpu_manager
 from app.core.manager.session_manager import session_manager
 from app.core.manager.task_manager import task_manager
@@ -29,7 +30,7 @@ async def health_check():
     # Convert to GPUStatus schema with difficulty mapping
     gpu_statuses = []
     for device in gpu_devices:
-        difficulty = settings.GPU_DEVICE_DIFFICULTY.get(device.device_id, "low")
+        difficulty = settings.gpu_difficulty_by_id.get(device.device_id, "low")
 
         gpu_status = GPUStatus(
             device_id=device.device_id,
@@ -85,7 +86,7 @@ async def resource_allocation() -> Dict[str, Any]:
 
     gpu_allocation = []
     for device in gpu_devices:
-        difficulty = settings.GPU_DEVICE_DIFFICULTY.get(device.device_id, "low")
+        difficulty = settings.gpu_difficulty_by_id.get(device.device_id, "low")
 
         gpu_info = {
             "device_id": device.device_id,
@@ -105,10 +106,15 @@ async def resource_allocation() -> Dict[str, Any]:
 
     # Get running tasks from TaskManager
     running_task_ids = task_manager.get_running_tasks()
+    task_containers = task_manager.get_task_containers()
 
     # Get session information
     all_sessions = await session_manager.get_all_sessions()
 
+    # Container CPU/memory usage (cgroupfs reads only, None when not mounted)
+    container_ids = list(task_containers.values()) + [s.container_id for s in all_sessions]
+    container_stats = {cid: docker_manager.get_container_stats(cid) for cid in container_ids}
+
     sessions_info = []
     for session in all_sessions:
         session_info = {
@@ -117,9 +123,10 @@ async def resource_allocation() -> Dict[str, Any]:
             "gpu_device_id": session.gpu_device_id,
             "model_id": session.model_id,
             "current_task_id": session.current_task_id,
-            "created_at": session.created_at.isoformat(),
+            "created_at": session.created_at_iso,
             "last_activity": session.last_activity.isoformat(),
-            "queue_size": session.request_queue.qsize() if hasattr(session, 'request_queue') else 0
+            "queue_size": session.request_queue.qsize() if hasattr(session, 'request_queue') else 0,
+            "container_stats": container_stats.get(session.container_id)
         }
         sessions_info.append(session_info)
 
@@ -129,7 +136,11 @@ async def resource_allocation() -> Dict[str, Any]:
             "gpus": gpu_allocation,
             "running_tasks": {
                 "count": len(running_task_ids),
-                "task_ids": running_task_ids
+                "task_ids": running_task_ids,
+                "container_stats": {
+                    task_id: container_stats.get(container_id)
+                    for task_id, container_id in task_containers.items()
+                }
             },
             "sessions": {
                 "count": len(all_sessions),
@@ -142,8 +153,8 @@ async def resource_allocation() -> Dict[str, Any]:
             "total_gpus": len(gpu_devices),
             "available_gpus": len([g for g in gpu_devices if g.is_available]),
             "gpus_by_difficulty": {
-                "low": len([g for g in gpu_devices if settings.GPU_DEVICE_DIFFICULTY.get(g.device_id, "low") == "low"]),
-                "high": len([g for g in gpu_devices if settings.GPU_DEVICE_DIFFICULTY.get(g.device_id, "low") == "high"])
+                "low": len([g for g in gpu_devices if settings.gpu_difficulty_by_id.get(g.device_id, "low") == "low"]),
+                "high": len([g for g in gpu_devices if settings.gpu_difficulty_by_id.get(g.device_id, "low") == "high"])
             }
         }
     }
@@ -2,18 +2,18 @@
 Task submission and execution endpoints.
 """
 
-import logging
-
+import structlog
 from fastapi import APIRouter, HTTPException, Depends
 from sse_starlette.sse import EventSourceResponse
 
 from app.core.dependencies import verify_api_key
+from app.core.manager.task_manager import task_manager
 from shared_schemas.gpu_service import (
     PreDefinedTaskRequest,
     CustomTaskRequest,
 )
 
-logger = logging.getLogger(__name__)
+logger = structlog.get_logger(__name__)
 
 router = APIRouter(dependencies=[Depends(verify_api_key)])
 
@@ -36,7 +36,7 @@ async def run_predefined_task(request: PreDefinedTaskRequest):
     """
     from app.core.instance.task_request_handler import TaskRequestHandler
 
-    logger.info(f"Pre-defined task submission: task_name={request.task_name}")
+    logger.info("predefined_task_submitted", task_name=request.task_name)
 
     # Create handler
     handler = TaskRequestHandler(
@@ -48,8 +48,41 @@ async def run_predefined_task(request: PreDefinedTaskRequest):
         }
     )
 
-    # Execute pipeline and stream
-    return EventSourceResponse(handler.execute())
+    # Execute pipeline and stream pre-encoded SSE frames
+    return EventSourceResponse(handler.stream())
+
+
+@router.get("/tasks/{task_id}/events")
+async def watch_task(task_id: str):
+    """
+    Watch a running task's SSE stream from an additional client.
+
+    Receives the same encoded frames as the submitting client, starting
+    from the moment of subscription.
+
+    Args:
+        task_id: Task identifier
+
+    Returns:
+        EventSourceResponse with SSE stream
+
+    Raises:
+        HTTPException: 404 if the task is not running
+    """
+    instance = task_manager.get_task(task_id)
+    if instance is None:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not running")
+
+    queue = instance.subscribe()
+
+    async def event_stream():
+        try:
+            while (frame := await queue.get()) is not None:
+                yield frame
+        finally:
+            instance.unsubscribe(queue)
+
+    return EventSourceResponse(event_stream())
 
 
 @router.post("/tasks/custom")
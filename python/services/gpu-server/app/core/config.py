@@ -3,7 +3,8 @@ Configuration management for GPU Service.
 Loads environment variables using Pydantic Settings.
 """
 
-from typing import List, Dict, Union
+from functools import cached_property
+from typing import List, Dict, Union, Optional
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -45,14 +46,18 @@ class Settings(BaseSettings):
 
     # Docker Configuration
     ALLOWED_DOCKER_IMAGES: Union[str, List[str]]
+    DOCKER_MAX_POOL_SIZE: int = 32  # Pooled connections to the Docker daemon
+    CGROUP_ROOT: str = "/sys/fs/cgroup"  # Host cgroup v2 mount as seen by this service
 
     # Model Cache Configuration
     MODEL_CACHE_DIR: str
     AUTO_FETCH_MODELS: bool
+    MODEL_CACHE_VERIFY_ON_BOOT: bool = False  # Check cached files against their .b3 digest
 
     # File Service Integration
     FILE_SERVICE_URL: str
     FILE_SERVICE_INTERNAL_KEY: str
+    FILE_SERVICE_LOCAL_PATH: Optional[str] = None  # Shared mount with file-service (skips HTTP)
 
     # Authentication
     INTERNAL_API_KEY: str
@@ -91,6 +96,11 @@ class Settings(BaseSettings):
 
         return values
 
+    @cached_property
+    def gpu_difficulty_by_id(self) -> Dict[int, str]:
+        """GPU_DEVICE_DIFFICULTY with keys normalized to int device IDs."""
+        return {int(k): v for k, v in self.GPU_DEVICE_DIFFICULTY.items()}
+
     model_config = SettingsConfigDict(
         env_file=".env",
         case_sensitive=True,
@@ -21,11 +21,24 @@ async def get_http_client() -> httpx.AsyncClient:
     """
     Get or create the global HTTP client.
     Used for making requests to downstream services (file-service).
+
+    A long keepalive lets model fetches reuse pooled connections instead
+    of paying a TCP handshake each.
     """
     global _http_client
     if _http_client is None:
+        # Pool settings live on the transport when one is supplied
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=300
+            ),
+            retries=2
+        )
         _http_client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0, read=None),  # Allow streaming
+            transport=transport,
+            timeout=httpx.Timeout(10.0, read=300.0),  # Large model downloads
             follow_redirects=True
         )
     return _http_client
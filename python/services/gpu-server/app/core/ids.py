@@ -0,0 +1,22 @@
+"""
+Identifier generation for sessions and tasks.
+"""
+
+import os
+
+
+def new_id() -> str:
+    """
+    Generate a random RFC 4122 version-4 UUID string.
+
+    Equivalent to str(uuid.uuid4()) but formats the random bytes directly,
+    skipping UUID object construction.
+
+    Returns:
+        Canonical 36-character UUID string
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
@@ -5,14 +5,25 @@ Per-request instance that lazy-loads only the required task definition,
 task action, and model path for a specific task.
 """
 
+import sys
 import logging
 from pathlib import Path
-from typing import Dict, Optional, List, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, Optional, Any, Tuple, Mapping
 from dataclasses import dataclass
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C loader; fall back to the pure-Python loader if unavailable
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed YAML shared across ConfigLoader instances: path -> (mtime_ns, content)
+_yaml_cache: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+# Built TaskActions: (actions file, task_name) -> (parsed file content it was built from, action)
+_task_action_cache: Dict[Tuple[Path, str], Tuple[Dict[str, Any], "TaskAction"]] = {}
+
 
 @dataclass
 class TaskDefinition:
@@ -26,16 +37,33 @@ class TaskDefinition:
     model_id: Optional[str] = None  # Optional for non-LLM tasks
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskAction:
-    """Worker execution configuration for a task."""
+    """
+    Worker execution configuration for a task.
+
+    Command and env/build mappings are frozen so a single instance can be
+    handed to every container launch without defensive copies; ConfigLoader
+    builds one per task and file version and reuses it across requests.
+    """
     task_name: str
     source_path: str
     dockerfile: str
     docker_image: str
-    command: List[str]
-    env_vars: Dict[str, str]
-    build_args: Dict[str, str]
+    command: Tuple[str, ...]
+    env_vars: Mapping[str, str]
+    build_args: Mapping[str, str]
+
+    def __post_init__(self):
+        # tuple() would split a string command into characters
+        if not isinstance(self.command, (list, tuple)):
+            raise ValueError(
+                f"Task action {self.task_name}: command must be a list, "
+                f"got {type(self.command).__name__}"
+            )
+        self.command = tuple(self.command)
+        self.env_vars = MappingProxyType(dict(self.env_vars))
+        self.build_args = MappingProxyType(dict(self.build_args))
 
 
 @dataclass
@@ -72,16 +100,37 @@ class ConfigLoader:
         """
         Load a YAML file.
 
+        Parsed content is cached process-wide and only re-parsed when the
+        file's mtime changes, so config edits are still picked up without
+        paying a full parse on every request. Top-level keys are interned
+        since they are used as lookup keys on every task submission.
+
         Args:
             filename: Name of YAML file in config directory
 
         Returns:
-            Parsed YAML content as dictionary
+            Parsed YAML content as dictionary (shared; callers must not mutate it)
         """
         file_path = self.config_dir / filename
         try:
+            mtime_ns = file_path.stat().st_mtime_ns
+            cached = _yaml_cache.get(file_path)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
+
             with open(file_path, 'r') as f:
-                return yaml.safe_load(f) or {}
+                content = yaml.load(f, Loader=_YamlLoader) or {}
+
+            if not isinstance(content, dict):
+                logger.error(f"Config file {file_path} must contain a mapping at the top level")
+                return {}
+
+            content = {
+                sys.intern(key) if isinstance(key, str) else key: value
+                for key, value in content.items()
+            }
+            _yaml_cache[file_path] = (mtime_ns, content)
+            return content
         except FileNotFoundError:
             logger.error(f"Config file not found: {file_path}")
             return {}
@@ -113,7 +162,8 @@ class ConfigLoader:
             task_type=task_data.get("task_type", "oneoff"),
             task_difficulty=task_data.get("task_difficulty", "low"),
             timeout_seconds=task_data.get("timeout_seconds", 300),
-            metadata=task_data.get("metadata", {}),
+            # Copy: the parsed YAML is cached and shared across requests
+            metadata=dict(task_data.get("metadata", {})),
             model_id=task_data.get("model_id")
         )
 
@@ -129,13 +179,20 @@ class ConfigLoader:
         """
         config = self._load_yaml("task_actions.yaml")
 
+        # Reuse the action built from this parse of the file (a new mtime
+        # means a new content dict, which invalidates the entry)
+        cache_key = (self.config_dir / "task_actions.yaml", task_name)
+        cached = _task_action_cache.get(cache_key)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+
         if task_name not in config:
             logger.warning(f"Task action not found for task: {task_name}")
             return None
 
         action_data = config[task_name]
 
-        return TaskAction(
+        action = TaskAction(
             task_name=task_name,
             source_path=action_data.get("source_path", ""),
             dockerfile=action_data.get("dockerfile", ""),
@@ -144,6 +201,8 @@ class ConfigLoader:
             env_vars=action_data.get("env_vars", {}),
             build_args=action_data.get("build_args", {})
         )
+        _task_action_cache[cache_key] = (config, action)
+        return action
 
     def get_model_path(self, model_id: str) -> Optional[ModelPath]:
         """
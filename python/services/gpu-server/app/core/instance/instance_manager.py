@@ -5,14 +5,15 @@ Handles:
 - Streaming docker logs
 - Parsing logs into structured events
 - Emitting SSE events
+- Fanning out encoded SSE frames to additional subscribers
 - Worker status tracking
 - Task timeout enforcement
 """
 
+import time
 import asyncio
 import logging
-from typing import AsyncIterator, Optional
-from datetime import datetime
+from typing import AsyncIterator, Optional, Set
 
 from app.core.manager.docker_manager import docker_manager
 from app.models.events import StreamEvent, EventParser
@@ -21,6 +22,9 @@ from shared_schemas.gpu_service import TaskStatus
 
 logger = logging.getLogger(__name__)
 
+# Frames buffered per watcher; the oldest are dropped when a slow client falls behind
+SUBSCRIBER_QUEUE_SIZE = 256
+
 
 class WorkerStatus:
     """Worker status tracking (for monitoring purposes)."""
@@ -53,6 +57,47 @@ class InstanceManager:
         self.task_id = task_id
         self.container_id = container_id
         self.timeout_seconds = timeout_seconds
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Register a watcher for this task's SSE frames.
+
+        Returns:
+            Queue receiving encoded SSE frames, then None when the stream ends
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a watcher queue."""
+        self._subscribers.discard(queue)
+
+    def publish(self, frame: Optional[bytes]):
+        """
+        Send one encoded SSE frame (or None for end of stream) to every watcher.
+
+        The same bytes object goes to all subscribers, so each event is
+        serialized once. Never blocks: a full queue drops its oldest frame.
+
+        Args:
+            frame: Encoded SSE frame, or None to signal end of stream
+        """
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(frame)
+
+    async def shutdown(self):
+        """
+        Stop the task's container.
+
+        The log stream then ends, so stream_task_execution() finishes and the
+        request handler's cleanup releases the GPU and unregisters the task.
+        """
+        logger.info(f"Stopping container {self.container_id[:12]} for task {self.task_id}")
+        await docker_manager.stop_container(self.container_id)
 
     async def stream_task_execution(
         self,
@@ -69,7 +114,7 @@ class InstanceManager:
         """
         logger.info(f"Starting log stream for task {self.task_id} (container={self.container_id[:12]})")
 
-        task_start_time = datetime.utcnow()
+        task_start_time = time.monotonic()
 
         try:
             # Emit WORKER event (container created)
@@ -80,7 +125,7 @@ class InstanceManager:
 
             async for log_line in log_stream:
                 # Check task timeout
-                elapsed = (datetime.utcnow() - task_start_time).total_seconds()
+                elapsed = time.monotonic() - task_start_time
                 if elapsed > self.timeout_seconds:
                     logger.warning(f"Task {self.task_id} exceeded timeout ({self.timeout_seconds}s)")
 
@@ -101,7 +146,7 @@ class InstanceManager:
                     yield event
 
             # Task completed successfully (container exited)
-            elapsed_seconds = int((datetime.utcnow() - task_start_time).total_seconds())
+            elapsed_seconds = int(time.monotonic() - task_start_time)
 
             logger.info(f"Task {self.task_id} completed successfully ({elapsed_seconds}s)")
 
@@ -2,12 +2,12 @@
 Task request handler with pipeline execution.
 """
 
-import uuid
 import logging
 from typing import Dict, Any, AsyncIterator, Optional
 
 from fastapi import HTTPException
 
+from app.core.ids import new_id
 from app.core.instance.config_loader import ConfigLoader, TaskDefinition, TaskAction, ModelPath
 from app.core.instance.instance_manager import InstanceManager
 from app.core.manager.model_downloader import model_downloader
@@ -31,7 +31,7 @@ class TaskRequestHandler:
     4. Create instance manager (InstanceManager instance per-request)
     5. Create Docker container (TaskManager.docker_manager singleton)
     6. Register with TaskManager (tracks running tasks)
-    7. Stream execution
+    7. Stream execution (stream() also fans frames out to watchers)
     """
 
     def __init__(
@@ -53,7 +53,7 @@ class TaskRequestHandler:
         self.request_overrides = request_overrides
 
         # Pipeline state
-        self.task_id = str(uuid.uuid4())
+        self.task_id = new_id()
         self.config_loader = ConfigLoader()  # Per-request instance
         self.task_def: Optional[TaskDefinition] = None
         self.task_action: Optional[TaskAction] = None
@@ -110,7 +110,7 @@ class TaskRequestHandler:
 
             # Step 6: Register with task manager
             logger.info(f"[{self.task_id}] Step 6: Registering task with TaskManager")
-            await task_manager.register_task(self.task_id, self.instance_mgr)
+            task_manager.register_task(self.task_id, self.instance_mgr)
 
             # Step 7: Stream execution
             logger.info(f"[{self.task_id}] Step 7: Streaming task execution")
@@ -130,6 +130,26 @@ class TaskRequestHandler:
             # Cleanup
             await self._cleanup()
 
+    async def stream(self) -> AsyncIterator[bytes]:
+        """
+        Execute the pipeline and yield encoded SSE frames.
+
+        Each event is serialized once; the same frame is published to any
+        watchers subscribed through the instance manager.
+
+        Yields:
+            SSE-formatted bytes
+        """
+        try:
+            async for event in self.execute():
+                frame = event.to_sse_format()
+                if self.instance_mgr is not None:
+                    self.instance_mgr.publish(frame)
+                yield frame
+        finally:
+            if self.instance_mgr is not None:
+                self.instance_mgr.publish(None)
+
     async def _load_config(self):
         """
         Step 1: Load configuration.
@@ -176,12 +196,9 @@ class TaskRequestHandler:
             return
 
         # Check if model exists, download if needed
-        import httpx
-        async with httpx.AsyncClient() as client:
-            self.model_host_path = await model_downloader.get_model_path(
-                model_id=self.model_path_config.model_id,
-                http_client=client
-            )
+        self.model_host_path = await model_downloader.get_model_path(
+            model_id=self.model_path_config.model_id
+        )
 
         if not self.model_host_path:
             raise HTTPException(
@@ -216,6 +233,12 @@ class TaskRequestHandler:
 
         Creates one-off container using Docker Manager singleton.
         """
+        # Re-check the mount source: Docker binds a missing host path as an
+        # empty directory instead of failing, so a cache hit trusted without
+        # a stat could silently start the worker with no model
+        if self.model_host_path and not model_downloader.verify(self.model_path_config.model_id):
+            await self._prepare_model()
+
         # Prepare volume mounts (model path if provided)
         volume_mounts = {}
         if self.model_host_path:
@@ -263,7 +286,7 @@ class TaskRequestHandler:
         logger.info(f"[{self.task_id}] Cleaning up resources")
 
         # Unregister from task manager
-        await task_manager.unregister_task(self.task_id)
+        task_manager.unregister_task(self.task_id)
 
         # Release GPU
         if self.gpu_id is not None:
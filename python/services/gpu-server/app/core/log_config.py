@@ -0,0 +1,59 @@
+"""
+Logging configuration - structlog with orjson-rendered JSON lines.
+
+structlog loggers and the stdlib loggers used by the managers share one
+handler, so every record is emitted as a single JSON object per line.
+"""
+
+import logging
+
+import orjson
+import structlog
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """JSONRenderer serializer; the stdlib handler needs str, orjson returns bytes."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+def configure_logging(level: str):
+    """
+    Route structlog and stdlib logging through a JSON renderer.
+
+    Records below the configured level are dropped by filter_by_level
+    before any processor runs, and stdlib records keep their lazy
+    %-style arguments until a handler actually emits them.
+
+    Args:
+        level: Log level name (e.g. "INFO")
+    """
+    shared_processors = [
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+    ]
+
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            *shared_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        foreign_pre_chain=shared_processors,
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ],
+    ))
+
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(getattr(logging, level.upper()))
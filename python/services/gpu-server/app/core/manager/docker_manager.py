@@ -10,9 +10,13 @@ Handles:
 - Container lifecycle management
 """
 
+import os
+import codecs
 import asyncio
 import logging
-from typing import Dict, List, Optional, AsyncIterator
+import threading
+import concurrent.futures
+from typing import Any, Dict, Optional, AsyncIterator, Mapping, Sequence
 import docker
 from docker.types import DeviceRequest
 
@@ -20,6 +24,17 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Log chunks buffered per stream; the reader thread blocks when the consumer falls behind
+LOG_QUEUE_MAX_CHUNKS = 64
+
+
+# Container cgroup directories relative to the cgroup v2 root
+# (systemd cgroup driver, then cgroupfs driver)
+_CGROUP_DIR_TEMPLATES = (
+    "system.slice/docker-{}.scope",
+    "docker/{}",
+)
+
 
 class DockerManager:
     """
@@ -41,16 +56,12 @@ class DockerManager:
         logger.info("Initializing Docker Manager...")
 
         try:
-            # Use from_env() which auto-detects the Docker socket
-            # This is more reliable than manually specifying the socket path
-            self._client = docker.from_env()
-
-            # Test connection
-            self._client.ping()
+            # Connecting is blocking I/O; run it off the event loop so it
+            # overlaps with the other managers' initialization
+            self._client, info = await asyncio.to_thread(self._connect)
             logger.info("Docker client initialized and connected")
 
             # Log Docker info
-            info = self._client.info()
             logger.info(f"Docker version: {info.get('ServerVersion', 'unknown')}")
 
             self._initialized = True
@@ -59,6 +70,18 @@ class DockerManager:
             logger.error(f"Failed to initialize Docker client: {e}")
             raise
 
+    @staticmethod
+    def _connect():
+        """Create the Docker client, test the connection and fetch daemon info (blocking)."""
+        # Use from_env() which auto-detects the Docker socket
+        # This is more reliable than manually specifying the socket path.
+        # One client is shared for the service lifetime; its connection
+        # pool is sized so concurrent log streams (each holds a socket)
+        # don't push other calls onto throwaway connections.
+        client = docker.from_env(max_pool_size=settings.DOCKER_MAX_POOL_SIZE)
+        client.ping()
+        return client, client.info()
+
     async def shutdown(self):
         """Shutdown Docker manager."""
         logger.info("Shutting down Docker Manager...")
@@ -75,8 +98,8 @@ class DockerManager:
         gpu_id: int,
         model_id: str,
         docker_image: str,
-        command: List[str],
-        env_vars: Dict[str, str],
+        command: Sequence[str],
+        env_vars: Mapping[str, str],
         model_host_path: str
     ) -> str:
         """
@@ -162,8 +185,8 @@ class DockerManager:
         task_id: str,
         gpu_id: int,
         docker_image: str,
-        command: List[str],
-        env_vars: Dict[str, str],
+        command: Sequence[str],
+        env_vars: Mapping[str, str],
         volume_mounts: Dict[str, str]
     ) -> str:
         """
@@ -294,43 +317,86 @@ class DockerManager:
         Yields:
             Log lines as strings
         """
+        # A dedicated reader thread drains the blocking docker-py stream and
+        # hands chunks to the event loop as soon as the socket delivers them,
+        # instead of one executor round trip per line. The queue is bounded:
+        # when the consumer (e.g. a slow SSE client) falls behind, the thread
+        # blocks and backpressure reaches the Docker socket.
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_MAX_CHUNKS)
+        stopped = threading.Event()
+        log_stream = None
+
+        def put(item) -> bool:
+            """Blocking put from the reader thread; False once the consumer has stopped."""
+            try:
+                future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            except RuntimeError:
+                return False  # Event loop already closed
+            while not stopped.is_set():
+                try:
+                    future.result(timeout=1.0)
+                    return True
+                except concurrent.futures.TimeoutError:
+                    continue
+            future.cancel()
+            return False
+
+        def pump():
+            """Blocking reader - runs on its own thread until the stream ends or is closed."""
+            try:
+                for chunk in log_stream:
+                    if not put(chunk):
+                        return
+            except Exception as e:
+                put(e)
+            finally:
+                put(None)
+
         try:
             container = self._client.containers.get(container_id)
 
             # Stream logs
-            log_generator = container.logs(
+            log_stream = container.logs(
                 stdout=True,
                 stderr=True,
                 stream=True,
                 follow=follow,
                 timestamps=False
             )
-
-            # Use asyncio.to_thread to prevent blocking the event loop
-            # The docker-py log_generator blocks on I/O, so we need to run it in a thread
-            loop = asyncio.get_event_loop()
-
-            def read_next_log():
-                """Blocking call to get next log line - runs in thread pool."""
-                try:
-                    return next(log_generator)
-                except StopIteration:
-                    return None
-
+            # Own thread rather than the default executor: a stream lives as
+            # long as its container and must not starve asyncio.to_thread calls
+            threading.Thread(target=pump, name=f"logs-{container_id[:12]}", daemon=True).start()
+
+            # Chunks are docker frames, not lines: split on newlines and
+            # carry partial lines (and split UTF-8 sequences) to the next chunk
+            decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+            pending = ""
             while True:
-                # Run blocking operation in thread pool
-                log_bytes = await loop.run_in_executor(None, read_next_log)
-
-                if log_bytes is None:
+                item = await queue.get()
+                if item is None:
                     break
+                if isinstance(item, Exception):
+                    raise item
+
+                pending += decoder.decode(item)
+                *lines, pending = pending.split("\n")
+                for line in lines:
+                    yield line.rstrip()
 
-                line = log_bytes.decode('utf-8').rstrip()
-                yield line
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield pending.rstrip()
 
         except docker.errors.NotFound:
             logger.error(f"Container {container_id} not found for log streaming")
         except Exception as e:
             logger.error(f"Error streaming logs from {container_id}: {e}")
+        finally:
+            # Unblocks the reader thread if the consumer stopped early
+            stopped.set()
+            if log_stream is not None:
+                log_stream.close()
 
     async def stop_container(self, container_id: str, timeout: int = 10):
         """
@@ -341,8 +407,10 @@ class DockerManager:
             timeout: Timeout in seconds before force kill
         """
         try:
-            container = self._client.containers.get(container_id)
-            container.stop(timeout=timeout)
+            # container.stop() blocks for up to `timeout` seconds; run it in a
+            # thread so several containers can be stopped concurrently
+            container = await asyncio.to_thread(self._client.containers.get, container_id)
+            await asyncio.to_thread(container.stop, timeout=timeout)
             logger.info(f"Stopped container {container_id[:12]}")
 
         except docker.errors.NotFound:
@@ -399,6 +467,45 @@ class DockerManager:
             logger.error(f"Error getting container status {container_id}: {e}")
             return None
 
+    def get_container_stats(self, container_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get container CPU and memory usage from its cgroup files.
+
+        Only cgroupfs is read (microseconds). The Docker stats API samples
+        for a second or more per container, so it is never used here; if the
+        cgroup is not visible (host /sys/fs/cgroup not mounted at
+        CGROUP_ROOT), stats are reported as unavailable.
+
+        Args:
+            container_id: Full container ID
+
+        Returns:
+            Dict with memory_bytes and cpu_usage_usec, or None if unavailable
+        """
+        return _read_cgroup_stats(container_id)
+
+
+def _read_cgroup_stats(container_id: str) -> Optional[Dict[str, Any]]:
+    """Read memory.current and cpu.stat usage_usec from the container's cgroup v2 directory."""
+    for template in _CGROUP_DIR_TEMPLATES:
+        cgroup_dir = os.path.join(settings.CGROUP_ROOT, template.format(container_id))
+        try:
+            with open(os.path.join(cgroup_dir, "memory.current"), "rb") as f:
+                memory_bytes = int(f.read())
+            with open(os.path.join(cgroup_dir, "cpu.stat"), "rb") as f:
+                cpu_usage_usec = None
+                for line in f:
+                    if line.startswith(b"usage_usec "):
+                        cpu_usage_usec = int(line[11:])
+                        break
+        except (OSError, ValueError):
+            continue
+        return {
+            "memory_bytes": memory_bytes,
+            "cpu_usage_usec": cpu_usage_usec
+        }
+    return None
+
 
 # Global docker manager instance
 docker_manager = DockerManager()
@@ -27,6 +27,11 @@ class GPUManager:
 
     def __init__(self):
         self._devices: Dict[int, GPUDevice] = {}
+        self._slot_devices: List[int] = []  # slot index -> device_id
+        self._slot_by_device: Dict[int, int] = {}  # device_id -> slot index
+        self._slots_by_difficulty: Dict[str, List[int]] = {}  # difficulty -> slot indexes
+        self._busy = bytearray()  # one flag per slot, 1 = allocated
+        self._handles: Dict[int, object] = {}  # device_id -> NVML handle
         self._lock = asyncio.Lock()
         self._initialized = False
         self._refresh_task: Optional[asyncio.Task] = None
@@ -47,32 +52,16 @@ class GPUManager:
                 memory_total_mb=8192,
                 is_available=True
             )
+            self._build_slots()
             self._initialized = True
             return
 
         try:
-            pynvml.nvmlInit()
-            device_count = pynvml.nvmlDeviceGetCount()
-            logger.info(f"Found {device_count} GPU device(s)")
-
-            # Initialize only configured devices
-            for device_id in settings.GPU_DEVICE_IDS:
-                if device_id >= device_count:
-                    logger.warning(f"GPU device {device_id} not found (only {device_count} devices available)")
-                    continue
-
-                handle = pynvml.nvmlDeviceGetHandleByIndex(device_id)
-                name = pynvml.nvmlDeviceGetName(handle)
-                memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-
-                self._devices[device_id] = GPUDevice(
-                    device_id=device_id,
-                    name=name if isinstance(name, str) else name.decode('utf-8'),
-                    memory_total_mb=memory_info.total // (1024 * 1024),
-                    is_available=True
-                )
-                logger.info(f"Initialized GPU {device_id}: {self._devices[device_id].name}")
+            # NVML calls are blocking; run them off the event loop so they
+            # overlap with the other managers' initialization
+            await asyncio.to_thread(self._init_nvml_devices)
 
+            self._build_slots()
             self._initialized = True
 
             # Start background metrics refresh
@@ -88,8 +77,50 @@ class GPUManager:
                 memory_total_mb=8192,
                 is_available=True
             )
+            self._build_slots()
             self._initialized = True
 
+    def _init_nvml_devices(self):
+        """Initialize NVML and register the configured devices (blocking)."""
+        pynvml.nvmlInit()
+        device_count = pynvml.nvmlDeviceGetCount()
+        logger.info(f"Found {device_count} GPU device(s)")
+
+        # Initialize only configured devices
+        for device_id in settings.GPU_DEVICE_IDS:
+            if device_id >= device_count:
+                logger.warning(f"GPU device {device_id} not found (only {device_count} devices available)")
+                continue
+
+            handle = pynvml.nvmlDeviceGetHandleByIndex(device_id)
+            self._handles[device_id] = handle
+            name = pynvml.nvmlDeviceGetName(handle)
+            memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+
+            self._devices[device_id] = GPUDevice(
+                device_id=device_id,
+                name=name if isinstance(name, str) else name.decode('utf-8'),
+                memory_total_mb=memory_info.total // (1024 * 1024),
+                is_available=True
+            )
+            logger.info(f"Initialized GPU {device_id}: {self._devices[device_id].name}")
+
+    def _build_slots(self):
+        """
+        Index devices into allocation slots.
+
+        Slots are in device ID order, and each difficulty keeps its own
+        slot list, so allocation fills the lowest free device ID of a class.
+        """
+        difficulty_by_id = settings.gpu_difficulty_by_id
+        self._slot_devices = sorted(self._devices)
+        self._slot_by_device = {device_id: slot for slot, device_id in enumerate(self._slot_devices)}
+        self._slots_by_difficulty = {}
+        for slot, device_id in enumerate(self._slot_devices):
+            difficulty = difficulty_by_id.get(device_id, "low")
+            self._slots_by_difficulty.setdefault(difficulty, []).append(slot)
+        self._busy = bytearray(len(self._slot_devices))
+
     async def shutdown(self):
         """Shutdown GPU Manager and cleanup resources."""
         logger.info("Shutting down GPU Manager...")
@@ -124,13 +155,13 @@ class GPUManager:
             GPU device ID if allocated, None if all matching GPUs are busy
         """
         async with self._lock:
-            # Get GPU IDs matching the difficulty level
-            matching_gpus = self.get_gpus_by_difficulty(task_difficulty)
-
-            # Find first available GPU in matching set
-            for device_id in matching_gpus:
-                device = self._devices.get(device_id)
-                if device and device.is_available:
+            # First free slot among GPUs of this difficulty
+            busy = self._busy
+            for slot in self._slots_by_difficulty.get(task_difficulty, ()):
+                if not busy[slot]:
+                    busy[slot] = 1
+                    device_id = self._slot_devices[slot]
+                    device = self._devices[device_id]
                     device.is_available = False
                     device.current_job_id = task_id
                     logger.info(f"Allocated GPU {device_id} (difficulty={task_difficulty}) to task {task_id}")
@@ -149,15 +180,7 @@ class GPUManager:
         Returns:
             List of device IDs matching the difficulty
         """
-        from app.core.config import settings
-
-        matching_gpus = []
-        for device_id in self._devices.keys():
-            gpu_difficulty = settings.GPU_DEVICE_DIFFICULTY.get(device_id, "low")
-            if gpu_difficulty == difficulty:
-                matching_gpus.append(device_id)
-
-        return matching_gpus
+        return [self._slot_devices[slot] for slot in self._slots_by_difficulty.get(difficulty, ())]
 
     async def release_gpu(self, device_id: int, task_id: Optional[str] = None):
         """
@@ -169,6 +192,7 @@ class GPUManager:
         """
         async with self._lock:
             if device_id in self._devices:
+                self._busy[self._slot_by_device[device_id]] = 0
                 job_id = self._devices[device_id].current_job_id
                 self._devices[device_id].is_available = True
                 self._devices[device_id].current_job_id = None
@@ -208,8 +232,8 @@ class GPUManager:
             return
 
         try:
-            for device_id, device in self._devices.items():
-                handle = pynvml.nvmlDeviceGetHandleByIndex(device_id)
+            for device_id, handle in self._handles.items():
+                device = self._devices[device_id]
 
                 # Memory
                 memory_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
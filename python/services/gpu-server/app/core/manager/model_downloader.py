@@ -3,17 +3,64 @@ Model downloader with automatic fetching from file-service.
 """
 
 import os
+import mmap
+import stat
+import time
+import errno
+import shutil
 import logging
 import asyncio
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict
 
 import httpx
 
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+    logging.warning("blake3 not available - model cache verification disabled")
+
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Sidecar file holding the blake3 hex digest of a cached model file
+DIGEST_SUFFIX = ".b3"
+
+# How long a cache hit is trusted before the path is re-stat'ed
+CACHE_VERIFY_INTERVAL_SECONDS = 60.0
+
+
+@dataclass
+class CacheEntry:
+    """Cached model location with the stat info seen when it was verified."""
+    path: str
+    is_dir: bool
+    mtime_ns: int
+    size: int
+    verified_at: float  # time.monotonic()
+
+    @classmethod
+    def from_stat(cls, path: str, st: os.stat_result) -> "CacheEntry":
+        return cls(
+            path=path,
+            is_dir=stat.S_ISDIR(st.st_mode),
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            verified_at=time.monotonic()
+        )
+
+    def matches(self, st: os.stat_result) -> bool:
+        """Whether a fresh stat still describes the file that was cached."""
+        return (
+            stat.S_ISDIR(st.st_mode) == self.is_dir
+            and st.st_mtime_ns == self.mtime_ns
+            and st.st_size == self.size
+        )
+
 
 class ModelDownloader:
     """
@@ -28,15 +75,23 @@ class ModelDownloader:
 
     def __init__(self):
         self._cache_dir = Path(settings.MODEL_CACHE_DIR)
-        self._cache_registry: Dict[str, str] = {}  # model_id -> host_path
-        self._fetch_locks: Dict[str, asyncio.Lock] = {}  # Prevent concurrent fetches
+        self._cache_registry: Dict[str, CacheEntry] = {}  # model_id -> cache entry
+        self._inflight: Dict[str, asyncio.Task] = {}  # model_id -> in-progress fetch
+        self._http_client: Optional[httpx.AsyncClient] = None
         self._initialized = False
 
-    async def initialize(self):
-        """Initialize model cache directory."""
+    async def initialize(self, http_client: httpx.AsyncClient):
+        """
+        Initialize model cache directory.
+
+        Args:
+            http_client: Shared HTTP client for file-service requests
+        """
         if self._initialized:
             return
 
+        self._http_client = http_client
+
         logger.info(f"Initializing Model Downloader at {self._cache_dir}")
 
         # Create cache directory if it doesn't exist
@@ -56,111 +111,239 @@ class ModelDownloader:
     async def _scan_existing_models(self):
         """Scan cache directory for existing models."""
         try:
-            for item in self._cache_dir.iterdir():
-                if item.is_dir() or item.is_file():
-                    model_id = item.name
-                    self._cache_registry[model_id] = str(item)
-                    logger.debug(f"Found cached model: {model_id}")
+            with os.scandir(self._cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(DIGEST_SUFFIX):
+                        continue
+                    if entry.is_dir() or entry.is_file():
+                        model_id = entry.name
+                        self._cache_registry[model_id] = CacheEntry.from_stat(entry.path, entry.stat())
+                        logger.debug(f"Found cached model: {model_id}")
         except Exception as e:
             logger.error(f"Error scanning existing models: {e}")
 
-    async def get_model_path(
-        self,
-        model_id: str,
-        http_client: httpx.AsyncClient
-    ) -> Optional[str]:
+        if settings.MODEL_CACHE_VERIFY_ON_BOOT:
+            await self._verify_cached_models()
+
+    async def _verify_cached_models(self):
+        """
+        Verify cached model files against their blake3 sidecar digests.
+
+        Files are hashed in parallel worker threads. Mismatched files are
+        removed so they are re-fetched on next use; files without a sidecar
+        (e.g. pre-seeded or linked from a local mount) are trusted.
+        """
+        if not BLAKE3_AVAILABLE:
+            logger.warning("MODEL_CACHE_VERIFY_ON_BOOT set but blake3 not installed, skipping verification")
+            return
+
+        to_verify = {}
+        for model_id, entry in self._cache_registry.items():
+            digest_path = entry.path + DIGEST_SUFFIX
+            if os.path.isfile(entry.path) and os.path.exists(digest_path):
+                to_verify[model_id] = digest_path
+
+        if not to_verify:
+            return
+
+        logger.info(f"Verifying {len(to_verify)} cached model(s)...")
+        results = await asyncio.gather(*(
+            asyncio.to_thread(_verify_digest, self._cache_registry[model_id].path, digest_path)
+            for model_id, digest_path in to_verify.items()
+        ), return_exceptions=True)
+
+        for (model_id, digest_path), ok in zip(to_verify.items(), results):
+            if ok is True:
+                continue
+            path = self._cache_registry.pop(model_id).path
+            reason = "digest mismatch" if ok is False else ok
+            logger.warning(f"Cached model {model_id} failed verification ({reason}), removing")
+            for stale in (path, digest_path):
+                try:
+                    os.remove(stale)
+                except OSError as e:
+                    logger.error(f"Error removing {stale}: {e}")
+
+    async def get_model_path(self, model_id: str) -> Optional[str]:
         """
         Get local path for model, fetching from file-service if needed.
 
         Args:
             model_id: Model identifier
-            http_client: HTTP client for file-service requests
 
         Returns:
             Local host path to model, or None if fetch failed
         """
-        # Check if already cached
-        if model_id in self._cache_registry:
-            path = self._cache_registry[model_id]
-            if os.path.exists(path):
-                logger.info(f"Model {model_id} found in cache: {path}")
-                return path
-            else:
-                logger.warning(f"Cached model {model_id} no longer exists at {path}, will re-fetch")
-                del self._cache_registry[model_id]
+        # Check if already cached (re-stat only once the entry goes stale)
+        entry = self._cache_registry.get(model_id)
+        if entry is not None:
+            now = time.monotonic()
+            if now - entry.verified_at < CACHE_VERIFY_INTERVAL_SECONDS:
+                return entry.path
+            if self.verify(model_id):
+                logger.info(f"Model {model_id} found in cache: {entry.path}")
+                return entry.path
 
         # Auto-fetch if enabled
         if not settings.AUTO_FETCH_MODELS:
             logger.warning(f"Model {model_id} not in cache and auto-fetch disabled")
             return None
 
-        # Fetch from file-service
-        return await self._fetch_model(model_id, http_client)
-
-    async def _fetch_model(
-        self,
-        model_id: str,
-        http_client: httpx.AsyncClient
-    ) -> Optional[str]:
+        # Coalesce concurrent fetches of the same model onto one task. The
+        # fetch runs as its own task and every caller awaits it shielded, so a
+        # cancelled caller (e.g. disconnected SSE client) doesn't abort it.
+        task = self._inflight.get(model_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_model(model_id))
+            self._inflight[model_id] = task
+            task.add_done_callback(lambda _: self._inflight.pop(model_id, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_model(self, model_id: str) -> Optional[str]:
         """
         Fetch model from file-service and save to cache.
 
         Args:
             model_id: Model identifier
-            http_client: HTTP client for file-service requests
 
         Returns:
             Local path to downloaded model, or None if failed
         """
-        # Prevent concurrent fetches of same model
-        if model_id not in self._fetch_locks:
-            self._fetch_locks[model_id] = asyncio.Lock()
+        # Shared filesystem with file-service: no bytes over HTTP
+        if settings.FILE_SERVICE_LOCAL_PATH:
+            local_path = await self._fetch_model_local(model_id)
+            if local_path:
+                return local_path
 
-        async with self._fetch_locks[model_id]:
-            # Check again in case another task fetched it
-            if model_id in self._cache_registry:
-                return self._cache_registry[model_id]
+        logger.info(f"Fetching model {model_id} from file-service...")
+
+        try:
+            # Request model from file-service
+            # Assuming file-service has an internal API for model access
+            response = await self._http_client.get(
+                f"{settings.FILE_SERVICE_URL}/internal/models/{model_id}",
+                headers={"X-Internal-Key": settings.FILE_SERVICE_INTERNAL_KEY}
+            )
+
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch model {model_id}: HTTP {response.status_code}")
+                return None
+
+            # Save model to cache
+            model_path = self._cache_dir / model_id
+            model_path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write model data
+            content = response.content
+            with open(model_path, 'wb') as f:
+                f.write(content)
+
+            # Record digest for verification on later boots
+            if BLAKE3_AVAILABLE:
+                digest = await asyncio.to_thread(lambda: blake3.blake3(content).hexdigest())
+                with open(f"{model_path}{DIGEST_SUFFIX}", 'w') as f:
+                    f.write(digest)
+
+            # Register in cache
+            model_path_str = str(model_path)
+            self._register(model_id, model_path_str)
 
-            logger.info(f"Fetching model {model_id} from file-service...")
+            logger.info(f"Successfully cached model {model_id} at {model_path_str}")
+            return model_path_str
+
+        except httpx.TimeoutException:
+            logger.error(f"Timeout fetching model {model_id} from file-service")
+            return None
+        except Exception as e:
+            logger.error(f"Error fetching model {model_id}: {e}")
+            return None
+
+    async def _fetch_model_local(self, model_id: str) -> Optional[str]:
+        """
+        Link or copy model from the file-service's local mount into the cache.
+
+        Args:
+            model_id: Model identifier
 
-            try:
-                # Request model from file-service
-                # Assuming file-service has an internal API for model access
-                response = await http_client.get(
-                    f"{settings.FILE_SERVICE_URL}/internal/models/{model_id}",
-                    headers={"X-Internal-Key": settings.FILE_SERVICE_INTERNAL_KEY},
-                    timeout=300.0  # 5 minute timeout for large models
+        Returns:
+            Local path to cached model, or None if not available locally
+        """
+        src = Path(settings.FILE_SERVICE_LOCAL_PATH) / model_id
+        if not src.exists():
+            logger.debug(f"Model {model_id} not found on local file-service mount {src}")
+            return None
+
+        model_path = self._cache_dir / model_id
+        try:
+            if src.is_dir():
+                await asyncio.to_thread(
+                    shutil.copytree, src, model_path,
+                    copy_function=_link_or_copy, dirs_exist_ok=True
                 )
+            else:
+                await asyncio.to_thread(_link_or_copy, src, model_path)
+        except OSError as e:
+            logger.error(f"Error linking model {model_id} from {src}: {e}")
+            return None
 
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch model {model_id}: HTTP {response.status_code}")
-                    return None
+        model_path_str = str(model_path)
+        self._register(model_id, model_path_str)
 
-                # Save model to cache
-                model_path = self._cache_dir / model_id
-                model_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Linked model {model_id} from local file-service mount at {model_path_str}")
+        return model_path_str
 
-                # Write model data
-                with open(model_path, 'wb') as f:
-                    f.write(response.content)
+    def _register(self, model_id: str, path: str):
+        """Record a freshly written model in the cache registry."""
+        self._cache_registry[model_id] = CacheEntry.from_stat(path, os.stat(path))
 
-                # Register in cache
-                model_path_str = str(model_path)
-                self._cache_registry[model_id] = model_path_str
+    def verify(self, model_id: str) -> bool:
+        """
+        Re-stat a cached model and check it is still the file that was cached.
 
-                logger.info(f"Successfully cached model {model_id} at {model_path_str}")
-                return model_path_str
+        A missing path, or one whose kind, size or mtime changed (e.g. an
+        empty directory Docker created in its place for a bind mount), drops
+        the entry so the next request re-fetches it.
 
-            except httpx.TimeoutException:
-                logger.error(f"Timeout fetching model {model_id} from file-service")
-                return None
-            except Exception as e:
-                logger.error(f"Error fetching model {model_id}: {e}")
-                return None
+        Args:
+            model_id: Model identifier
+
+        Returns:
+            True if the cached path is unchanged, False otherwise
+        """
+        entry = self._cache_registry.get(model_id)
+        if entry is None:
+            return False
+
+        try:
+            st = os.stat(entry.path)
+        except OSError:
+            logger.warning(f"Cached model {model_id} no longer exists at {entry.path}, will re-fetch")
+            self.invalidate(model_id)
+            return False
+
+        if not entry.matches(st):
+            logger.warning(f"Cached model {model_id} changed on disk at {entry.path}, will re-fetch")
+            self.invalidate(model_id)
+            return False
+
+        entry.verified_at = time.monotonic()
+        return True
+
+    def invalidate(self, model_id: str):
+        """
+        Drop a model from the registry so the next request re-fetches it.
+
+        Called when a cached path is found missing or changed on disk.
+
+        Args:
+            model_id: Model identifier
+        """
+        if self._cache_registry.pop(model_id, None) is not None:
+            logger.info(f"Invalidated cached model: {model_id}")
 
     def get_cached_models(self) -> Dict[str, str]:
-        """Get dictionary of all cached models."""
-        return self._cache_registry.copy()
+        """Get dictionary of all cached models (model_id -> host path)."""
+        return {model_id: entry.path for model_id, entry in self._cache_registry.items()}
 
     async def clear_cache(self, model_id: Optional[str] = None):
         """
@@ -171,20 +354,22 @@ class ModelDownloader:
         """
         if model_id:
             if model_id in self._cache_registry:
-                path = self._cache_registry[model_id]
+                path = self._cache_registry[model_id].path
                 try:
-                    if os.path.exists(path):
-                        os.remove(path)
+                    for stale in (path, path + DIGEST_SUFFIX):
+                        if os.path.exists(stale):
+                            os.remove(stale)
                     del self._cache_registry[model_id]
                     logger.info(f"Cleared cached model: {model_id}")
                 except Exception as e:
                     logger.error(f"Error clearing model {model_id}: {e}")
         else:
             # Clear all cached models
-            for model_id, path in list(self._cache_registry.items()):
+            for model_id, path in self.get_cached_models().items():
                 try:
-                    if os.path.exists(path):
-                        os.remove(path)
+                    for stale in (path, path + DIGEST_SUFFIX):
+                        if os.path.exists(stale):
+                            os.remove(stale)
                 except Exception as e:
                     logger.error(f"Error removing {path}: {e}")
 
@@ -192,5 +377,50 @@ class ModelDownloader:
             logger.info("Cleared all cached models")
 
 
+def _hash_file(path: str) -> str:
+    """Compute blake3 hex digest of a file via a read-only sequential mmap."""
+    hasher = blake3.blake3()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hasher.hexdigest()
+        with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as mm:
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            hasher.update(mm)
+    return hasher.hexdigest()
+
+
+def _verify_digest(path: str, digest_path: str) -> bool:
+    """Check a file against the hex digest stored in its sidecar."""
+    with open(digest_path, 'r') as f:
+        expected = f.read().strip()
+    return _hash_file(path) == expected
+
+
+def _link_or_copy(src, dst):
+    """
+    Hardlink src to dst, falling back to an in-kernel sendfile copy when
+    the two paths are on different filesystems.
+    """
+    if os.path.lexists(dst):
+        os.unlink(dst)
+
+    try:
+        os.link(src, dst)
+        return dst
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    return dst
+
+
 # Global model downloader instance (singleton)
 model_downloader = ModelDownloader()
@@ -11,8 +11,8 @@ Handles:
 
 import asyncio
 import logging
+from collections import Counter
 from typing import Dict, Optional, List
-from datetime import datetime
 
 from app.models.session import Session
 from app.models.task import Task
@@ -33,6 +33,7 @@ class SessionManager:
         self._lock = asyncio.Lock()
         self._initialized = False
         self._monitor_task: Optional[asyncio.Task] = None
+        self._dequeue_counts: Counter = Counter()  # session_id -> dequeues since last flush
 
     async def initialize(self):
         """Initialize session manager and start monitoring."""
@@ -153,9 +154,9 @@ class SessionManager:
             return False
 
         try:
-            await session.request_queue.put(task)
+            session.request_queue.put_nowait(task)
             session.mark_activity()
-            logger.info(f"Enqueued task {task.task_id} to session {session_id} (queue_size={session.queue_size})")
+            logger.debug("Enqueued task %s to session %s (queue_size=%d)", task.task_id, session_id, session.queue_size)
             return True
         except asyncio.QueueFull:
             logger.error(f"Session {session_id} queue unexpectedly full")
@@ -177,11 +178,15 @@ class SessionManager:
             return None
 
         try:
-            task = await asyncio.wait_for(
-                session.request_queue.get(),
-                timeout=timeout
-            )
-            logger.info(f"Dequeued task {task.task_id} from session {session_id}")
+            if timeout is None:
+                task = await session.request_queue.get()
+            else:
+                task = await asyncio.wait_for(
+                    session.request_queue.get(),
+                    timeout=timeout
+                )
+            self._dequeue_counts[session_id] += 1
+            logger.debug("Dequeued task %s from session %s", task.task_id, session_id)
             return task
         except asyncio.TimeoutError:
             return None
@@ -209,7 +214,7 @@ class SessionManager:
         if session:
             old_status = session.status
             session.status = status
-            logger.info(f"Session {session_id} status: {old_status.value} → {status.value}")
+            logger.debug("Session %s status: %s → %s", session_id, old_status.value, status.value)
 
     async def kill_session(self, session_id: str, reason: str = "manual"):
         """
@@ -265,6 +270,7 @@ class SessionManager:
         while True:
             try:
                 await asyncio.sleep(settings.SESSION_MONITOR_INTERVAL)
+                self._flush_dequeue_counts()
                 await self._check_timeouts()
             except asyncio.CancelledError:
                 logger.info("Session timeout monitor cancelled")
@@ -272,9 +278,19 @@ class SessionManager:
             except Exception as e:
                 logger.error(f"Error in session timeout monitor: {e}", exc_info=True)
 
+    def _flush_dequeue_counts(self):
+        """Log one summary record for all dequeues since the last flush."""
+        if not self._dequeue_counts:
+            return
+        logger.info(
+            "Dequeued %d tasks across %d sessions",
+            sum(self._dequeue_counts.values()),
+            len(self._dequeue_counts)
+        )
+        self._dequeue_counts.clear()
+
     async def _check_timeouts(self):
         """Check all sessions for timeouts and kill expired ones."""
-        now = datetime.utcnow()
         sessions_to_kill = []
 
         # Collect sessions to kill (don't modify dict during iteration)
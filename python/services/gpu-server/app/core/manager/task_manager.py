@@ -2,9 +2,8 @@
 Task manager singleton for tracking all running tasks.
 """
 
-import asyncio
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +16,13 @@ class TaskManager:
     - Hold references to GPU Manager, Session Manager, Docker Manager
     - Track all running tasks with their InstanceManagers
     - Provide unified interface for task lifecycle
+
+    Registration is a single dict operation with no awaits in between, so
+    it runs without a lock on the event loop.
     """
 
+    __slots__ = ("gpu_manager", "session_manager", "docker_manager", "_running_tasks")
+
     def __init__(self):
         # Import singletons here to avoid circular imports
         from app.core.manager.gpu_manager import gpu_manager
@@ -30,9 +34,8 @@ class TaskManager:
         self.docker_manager = docker_manager
 
         self._running_tasks: Dict[str, 'InstanceManager'] = {}  # task_id -> instance
-        self._lock = asyncio.Lock()
 
-    async def register_task(self, task_id: str, instance_manager: 'InstanceManager'):
+    def register_task(self, task_id: str, instance_manager: 'InstanceManager'):
         """
         Register a running task.
 
@@ -40,20 +43,30 @@ class TaskManager:
             task_id: Task identifier
             instance_manager: Instance manager handling this task
         """
-        async with self._lock:
-            self._running_tasks[task_id] = instance_manager
-            logger.info(f"Registered task {task_id} ({len(self._running_tasks)} total running)")
+        self._running_tasks[task_id] = instance_manager
+        logger.info(f"Registered task {task_id} ({len(self._running_tasks)} total running)")
 
-    async def unregister_task(self, task_id: str):
+    def unregister_task(self, task_id: str):
         """
         Unregister a completed/failed task.
 
         Args:
             task_id: Task identifier
         """
-        async with self._lock:
-            self._running_tasks.pop(task_id, None)
-            logger.info(f"Unregistered task {task_id} ({len(self._running_tasks)} remaining)")
+        self._running_tasks.pop(task_id, None)
+        logger.info(f"Unregistered task {task_id} ({len(self._running_tasks)} remaining)")
+
+    def get_task(self, task_id: str) -> Optional['InstanceManager']:
+        """
+        Get the instance manager of a running task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            InstanceManager if the task is running, None otherwise
+        """
+        return self._running_tasks.get(task_id)
 
     def get_running_tasks(self) -> List[str]:
         """
@@ -64,6 +77,15 @@ class TaskManager:
         """
         return list(self._running_tasks.keys())
 
+    def get_task_containers(self) -> Dict[str, str]:
+        """
+        Get containers of running tasks.
+
+        Returns:
+            Dict of task_id -> container_id
+        """
+        return {task_id: instance.container_id for task_id, instance in self._running_tasks.items()}
+
     async def shutdown_task(self, task_id: str):
         """
         Force shutdown a running task.
@@ -4,13 +4,17 @@ GPU Service - Main FastAPI Application
 Session-based GPU task execution service with SSE streaming.
 """
 
-import logging
+import asyncio
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+import structlog
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
+from app.core.dependencies import get_http_client, close_http_client
+from app.core.log_config import configure_logging
 from app.core.manager.gpu_manager import gpu_manager
 from app.core.manager.session_manager import session_manager
 from app.core.manager.docker_manager import docker_manager
@@ -19,12 +23,9 @@ from app.core.manager.task_manager import task_manager
 from app.api import health, tasks, sessions
 
 # Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+configure_logging(settings.LOG_LEVEL)
 
-logger = logging.getLogger(__name__)
+logger = structlog.get_logger(__name__)
 
 
 @asynccontextmanager
@@ -34,60 +35,65 @@ async def lifespan(app: FastAPI):
 
     Handles initialization and cleanup of all managers.
     """
-    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
+    logger.info("service_starting", app=settings.APP_NAME, version=settings.APP_VERSION)
 
     try:
-        # Initialize model downloader
-        logger.info("Initializing model downloader...")
-        await model_downloader.initialize()
-        logger.info(f"Model downloader initialized with {len(model_downloader.get_cached_models())} cached models")
-
-        # Initialize GPU manager
-        logger.info("Initializing GPU manager...")
-        await gpu_manager.initialize()
-        gpu_devices = await gpu_manager.get_gpu_status()
-        logger.info(f"Initialized {len(gpu_devices)} GPU device(s)")
+        # Model downloader, GPU manager and Docker manager are independent
+        logger.info("managers_initializing", managers=["model_downloader", "gpu", "docker"])
+        http_client = await get_http_client()
+        await asyncio.gather(
+            model_downloader.initialize(http_client),
+            gpu_manager.initialize(),
+            docker_manager.initialize()
+        )
+        logger.info("managers_initialized", cached_models=len(model_downloader.get_cached_models()))
 
-        for device in gpu_devices:
-            difficulty = settings.GPU_DEVICE_DIFFICULTY.get(device.device_id, "unknown")
-            logger.info(
-                f"  GPU {device.device_id}: {device.name} "
-                f"(difficulty={difficulty}, memory={device.memory_total_mb}MB)"
-            )
-
-        # Initialize Docker manager
-        logger.info("Initializing Docker manager...")
-        await docker_manager.initialize()
-        logger.info("Docker manager initialized")
+        gpu_devices = await gpu_manager.get_gpu_status()
+        difficulty_by_id = settings.gpu_difficulty_by_id
+        logger.info("gpus_initialized", count=len(gpu_devices), devices=[
+            {
+                "device_id": device.device_id,
+                "name": device.name,
+                "difficulty": difficulty_by_id.get(device.device_id, "unknown"),
+                "memory_mb": device.memory_total_mb
+            }
+            for device in gpu_devices
+        ])
 
         # Initialize session manager (starts background monitoring)
-        logger.info("Initializing session manager...")
         await session_manager.initialize()
-        logger.info("Session manager initialized")
+        logger.info("session_manager_initialized")
 
         # TaskManager is automatically initialized (holds references to singletons)
-        logger.info(f"TaskManager ready (tracking {len(task_manager.get_running_tasks())} running tasks)")
+        logger.info("task_manager_ready", running_tasks=len(task_manager.get_running_tasks()))
 
-        logger.info(f"{settings.APP_NAME} started successfully")
+        logger.info("service_started", app=settings.APP_NAME)
 
         yield
 
     finally:
         # Cleanup on shutdown
-        logger.info("Shutting down service...")
+        logger.info("service_stopping")
 
         # Shutdown all running tasks
         running_tasks = task_manager.get_running_tasks()
         if running_tasks:
-            logger.info(f"Shutting down {len(running_tasks)} running tasks...")
-            for task_id in running_tasks:
-                await task_manager.shutdown_task(task_id)
+            logger.info("tasks_stopping", count=len(running_tasks))
+            results = await asyncio.gather(
+                *(task_manager.shutdown_task(task_id) for task_id in running_tasks),
+                return_exceptions=True
+            )
+            for task_id, result in zip(running_tasks, results):
+                if isinstance(result, Exception):
+                    logger.error("task_shutdown_failed", task_id=task_id, error=str(result))
 
         # Shutdown session manager (kills all sessions)
-        logger.info("Shutting down sessions...")
         await session_manager.shutdown()
 
-        logger.info(f"{settings.APP_NAME} shutdown complete")
+        await docker_manager.shutdown()
+        await close_http_client()
+
+        logger.info("service_stopped", app=settings.APP_NAME)
 
 
 # Create FastAPI application
@@ -113,16 +119,20 @@ app.include_router(tasks.router, prefix="/api", tags=["Tasks"])
 app.include_router(sessions.router, prefix="/api", tags=["Sessions"])
 
 
+# Static root payload, serialized once
+_ROOT_BYTES = orjson.dumps({
+    "service": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "status": "running"
+})
+
+
 @app.get("/")
 async def root():
     """
     Root endpoint with service information.
     """
-    return {
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "status": "running"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -132,6 +142,8 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8001,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=False,
         log_level=settings.LOG_LEVEL.lower()
     )
@@ -6,30 +6,43 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+import orjson
+
 from shared_schemas.gpu_service import EventType
 
+# Pre-encoded SSE prefix per event type
+_EVENT_PREFIX: Dict[EventType, bytes] = {
+    et: f"event: {et.value}\ndata: ".encode() for et in EventType
+}
+
+# Worker "type" string -> EventType
+_EVENT_TYPE_BY_VALUE: Dict[str, EventType] = {et.value: et for et in EventType}
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class StreamEvent:
     """Single event in SSE stream."""
 
     event_type: EventType
     data: Dict[str, Any]
-    timestamp: datetime = None
+    timestamp: Optional[datetime] = None
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         if self.timestamp is None:
             self.timestamp = datetime.utcnow()
 
-    def to_sse_format(self) -> str:
+    def to_sse_format(self) -> bytes:
         """
         Convert to Server-Sent Events format.
 
         Returns:
-            SSE-formatted string
+            SSE-formatted bytes, ready to write to the response
         """
-        import json
-        return f"event: {self.event_type.value}\ndata: {json.dumps(self.data)}\n\n"
+        # Per-EventType formatters that splice only the payload value (e.g.
+        # orjson.dumps(data["delta"]) into a fixed '{"delta":...}' template)
+        # were measured ~1.7x slower than this: the Python-level shape check
+        # and extra concatenation cost more than orjson walking a small dict.
+        return _EVENT_PREFIX[self.event_type] + orjson.dumps(self.data) + b"\n\n"
 
     @classmethod
     def connection(
@@ -40,7 +53,7 @@ class StreamEvent:
         message: Optional[str] = None
     ) -> "StreamEvent":
         """Create CONNECTION event."""
-        data = {"status": status}
+        data: Dict[str, Any] = {"status": status}
         if gpu_id is not None:
             data["gpu_id"] = gpu_id
         if session_id:
@@ -58,7 +71,7 @@ class StreamEvent:
         error: Optional[str] = None
     ) -> "StreamEvent":
         """Create WORKER event."""
-        data = {"status": status}
+        data: Dict[str, Any] = {"status": status}
         if container_id:
             data["container_id"] = container_id
         if error:
@@ -84,7 +97,7 @@ class StreamEvent:
         timestamp: Optional[str] = None
     ) -> "StreamEvent":
         """Create LOGS event."""
-        data = {"log": log, "level": level}
+        data: Dict[str, Any] = {"log": log, "level": level}
         if timestamp:
             data["timestamp"] = timestamp
 
@@ -98,7 +111,7 @@ class StreamEvent:
         error: Optional[str] = None
     ) -> "StreamEvent":
         """Create TASK_FINISH event."""
-        data = {"status": status}
+        data: Dict[str, Any] = {"status": status}
         if elapsed_seconds is not None:
             data["elapsed_seconds"] = elapsed_seconds
         if error:
@@ -124,32 +137,26 @@ class EventParser:
         Returns:
             StreamEvent if parseable, None if empty/invalid
         """
-        import json
-
         line = line.strip()
         if not line:
             return None
 
         try:
             # Try to parse as JSON
-            data = json.loads(line)
+            data = orjson.loads(line)
 
-            if isinstance(data, dict) and "type" in data:
+            event_type_str = data.get("type") if isinstance(data, dict) else None
+            if isinstance(event_type_str, str):
                 # Structured event from worker
-                event_type_str = data.get("type")
                 event_data = data.get("data", {})
 
                 # Map type string to EventType enum
-                event_type = None
-                for et in EventType:
-                    if et.value == event_type_str:
-                        event_type = et
-                        break
+                event_type = _EVENT_TYPE_BY_VALUE.get(event_type_str)
 
                 if event_type:
                     return StreamEvent(event_type=event_type, data=event_data)
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         # Fallback: Treat as plain log
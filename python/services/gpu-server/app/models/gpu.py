@@ -3,10 +3,10 @@ GPU device data models.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class GPUDevice:
     """Represents a single GPU device."""
     device_id: int
@@ -18,7 +18,7 @@ class GPUDevice:
     is_available: bool = True
     current_job_id: Optional[str] = None
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
         return {
             "device_id": self.device_id,
@@ -2,16 +2,66 @@
 Session data models for internal use.
 """
 
-import uuid
+import time
 import asyncio
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Deque, Dict, Optional
 
+from app.core.ids import new_id
 from shared_schemas.gpu_service import SessionStatus
 
 
-@dataclass
+class RequestQueue:
+    """
+    Bounded single-producer/single-consumer FIFO for session requests.
+
+    The API handler enqueues and the session worker dequeues, so a deque
+    plus one wakeup event is enough; asyncio.Queue's waiter bookkeeping
+    is not needed.
+    """
+
+    def __init__(self, maxsize: int = 5) -> None:
+        self.maxsize = maxsize
+        self._deque: Deque[Any] = deque()
+        self._not_empty = asyncio.Event()
+
+    def put_nowait(self, item: Any) -> None:
+        """
+        Append item to the queue.
+
+        Raises:
+            asyncio.QueueFull: If the queue is at maxsize
+        """
+        if len(self._deque) >= self.maxsize:
+            raise asyncio.QueueFull
+        self._deque.append(item)
+        self._not_empty.set()
+
+    async def get(self) -> Any:
+        """Remove and return the next item, waiting until one is available."""
+        while not self._deque:
+            await self._not_empty.wait()
+        item = self._deque.popleft()
+        if not self._deque:
+            self._not_empty.clear()
+        return item
+
+    def qsize(self) -> int:
+        """Number of queued items."""
+        return len(self._deque)
+
+    def empty(self) -> bool:
+        """Check if queue is empty."""
+        return not self._deque
+
+    def full(self) -> bool:
+        """Check if queue is at maxsize."""
+        return len(self._deque) >= self.maxsize
+
+
+@dataclass(slots=True)
 class Session:
     """Represents a long-lived GPU session."""
 
@@ -24,16 +74,18 @@ class Session:
     # Status
     status: SessionStatus = SessionStatus.INITIALIZING
 
-    # Timestamps
+    # Timestamps (wall clock for responses, monotonic for timeout checks)
     created_at: datetime = field(default_factory=datetime.utcnow)
-    last_activity: datetime = field(default_factory=datetime.utcnow)
+    _created_mono: float = field(default_factory=time.monotonic, repr=False)
+    _last_activity_mono: float = field(default_factory=time.monotonic, repr=False)
+    _created_at_iso: Optional[str] = field(default=None, repr=False)
 
     # Lifecycle limits
     idle_timeout_seconds: int = 300  # 5 minutes
     max_lifetime_seconds: int = 3600  # 1 hour
 
     # Request queue (FIFO, max 3-5 requests)
-    request_queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=5))
+    request_queue: RequestQueue = field(default_factory=lambda: RequestQueue(maxsize=5))
 
     # Metadata
     current_task_id: Optional[str] = None
@@ -63,7 +115,7 @@ class Session:
             New Session instance
         """
         return cls(
-            session_id=str(uuid.uuid4()),
+            session_id=new_id(),
             container_id=container_id,
             gpu_device_id=gpu_device_id,
             model_id=model_id,
@@ -72,21 +124,31 @@ class Session:
             max_lifetime_seconds=max_lifetime_seconds
         )
 
-    def mark_activity(self):
+    @property
+    def created_at_iso(self) -> str:
+        """ISO-8601 form of created_at, formatted once (created_at never changes)."""
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+        return self._created_at_iso
+
+    @property
+    def last_activity(self) -> datetime:
+        """Wall-clock time of last activity, derived from the monotonic clock."""
+        return self.created_at + timedelta(seconds=self._last_activity_mono - self._created_mono)
+
+    def mark_activity(self) -> None:
         """Update last activity timestamp."""
-        self.last_activity = datetime.utcnow()
+        self._last_activity_mono = time.monotonic()
 
     def is_idle_timeout_exceeded(self) -> bool:
         """Check if session has been idle too long."""
         if self.status != SessionStatus.WAITING:
             return False
-        idle_time = (datetime.utcnow() - self.last_activity).total_seconds()
-        return idle_time > self.idle_timeout_seconds
+        return time.monotonic() - self._last_activity_mono > self.idle_timeout_seconds
 
     def is_max_lifetime_exceeded(self) -> bool:
         """Check if session has exceeded max lifetime."""
-        age = (datetime.utcnow() - self.created_at).total_seconds()
-        return age > self.max_lifetime_seconds
+        return time.monotonic() - self._created_mono > self.max_lifetime_seconds
 
     @property
     def queue_size(self) -> int:
@@ -98,7 +160,7 @@ class Session:
         """Check if request queue is full."""
         return self.request_queue.full()
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
         return {
             "session_id": self.session_id,
@@ -106,7 +168,7 @@ class Session:
             "gpu_device_id": self.gpu_device_id,
             "container_id": self.container_id,
             "model_id": self.model_id,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at_iso,
             "last_activity": self.last_activity.isoformat(),
             "queue_size": self.queue_size,
             "current_task_id": self.current_task_id
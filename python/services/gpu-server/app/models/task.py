@@ -2,15 +2,16 @@
 Task data models for internal use.
 """
 
-import uuid
+from collections import deque
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Deque, Dict, Any
 
+from app.core.ids import new_id
 from shared_schemas.gpu_service import TaskType, TaskStatus, TaskDifficulty
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a single task (within a session or one-off)."""
 
@@ -31,10 +32,11 @@ class Task:
     created_at: datetime = field(default_factory=datetime.utcnow)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
+    _created_at_iso: Optional[str] = field(default=None, repr=False)
 
     # Results and errors
     error_message: Optional[str] = None
-    recent_logs: list = field(default_factory=list)
+    recent_logs: Deque[str] = field(default_factory=lambda: deque(maxlen=10))  # Last 10 log lines
 
     @classmethod
     def create(
@@ -63,7 +65,7 @@ class Task:
             New Task instance
         """
         return cls(
-            task_id=str(uuid.uuid4()),
+            task_id=new_id(),
             task_type=task_type,
             task_difficulty=task_difficulty,
             model_id=model_id,
@@ -73,6 +75,13 @@ class Task:
             session_id=session_id
         )
 
+    @property
+    def created_at_iso(self) -> str:
+        """ISO-8601 form of created_at, formatted once (created_at never changes)."""
+        if self._created_at_iso is None:
+            self._created_at_iso = self.created_at.isoformat()
+        return self._created_at_iso
+
     @property
     def elapsed_seconds(self) -> Optional[int]:
         """Calculate elapsed time in seconds."""
@@ -81,7 +90,7 @@ class Task:
         end_time = self.completed_at or datetime.utcnow()
         return int((end_time - self.started_at).total_seconds())
 
-    def to_dict(self) -> dict:
+    def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
         return {
             "task_id": self.task_id,
@@ -92,11 +101,11 @@ class Task:
             "task_preset": self.task_preset,
             "session_id": self.session_id,
             "container_id": self.container_id,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self.created_at_iso,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "elapsed_seconds": self.elapsed_seconds,
             "timeout_seconds": self.timeout_seconds,
             "error_message": self.error_message,
-            "recent_logs": self.recent_logs[-10:]  # Last 10 log lines
+            "recent_logs": list(self.recent_logs)
         }
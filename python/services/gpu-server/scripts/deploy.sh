@@ -246,8 +246,10 @@ ssh "$VM_HOST" << EOF
         --gpus all \
         -p 8001:8000 \
         -v /var/run/docker.sock:/var/run/docker.sock \
+        -v /sys/fs/cgroup:/host/cgroup:ro \
         -v \${MODEL_CACHE_DIR}:\${MODEL_CACHE_DIR} \
         --env-file .env \
+        -e CGROUP_ROOT=/host/cgroup \
         "$FULL_IMAGE_NAME"
 
     echo "✓ Container started"
@@ -3,6 +3,7 @@ Food classification endpoints.
 """
 
 import logging
+from typing import Optional
 
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
 
@@ -14,6 +15,20 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/classifications", tags=["classifications"])
 
+# Leading bytes of each supported image format -> media type
+_IMAGE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+)
+
+
+def _sniff_image_type(header: bytes) -> Optional[str]:
+    """Detect image media type from the file's first bytes."""
+    for signature, media_type in _IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return media_type
+    return None
+
 
 @router.post("/food", response_model=FoodClassificationResponse)
 async def classify_food_image(
@@ -34,8 +49,9 @@ async def classify_food_image(
     """
     logger.warning(f"Food classification requested for file: {file.filename}, but service not implemented")
 
-    # Validate file type
-    if file.content_type not in ["image/jpeg", "image/png", "image/jpg"]:
+    # Validate file type from magic bytes, not the client-supplied Content-Type
+    media_type = _sniff_image_type(await file.read(16))
+    if media_type is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only JPEG and PNG images are supported"
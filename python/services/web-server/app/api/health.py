@@ -2,9 +2,13 @@
 Health check endpoints.
 """
 
+import asyncio
 import logging
+from typing import Dict, Optional
 
-from fastapi import APIRouter, HTTPException, status
+import httpx
+import orjson
+from fastapi import APIRouter, HTTPException, Response, status
 
 from app.core.config import settings
 from app.core.dependencies import HTTPClient
@@ -14,6 +18,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["health"])
 
+# Static liveness payload, serialized once
+_HEALTH_BYTES = orjson.dumps(
+    HealthResponse(status="healthy", version=settings.APP_VERSION).model_dump()
+)
+
 
 @router.get("/health", response_model=HealthResponse)
 async def get_health_status():
@@ -22,84 +31,72 @@ async def get_health_status():
 
     Returns service status and version.
     """
-    return HealthResponse(
-        status="healthy",
-        version=settings.APP_VERSION
-    )
-
-
-@router.get("/health/services", response_model=HealthResponse)
-async def get_services_status(client: HTTPClient):
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+async def _probe(
+    client: httpx.AsyncClient,
+    name: str,
+    base_url: str,
+    path: str,
+    *,
+    timeout: float,
+    headers: Optional[Dict[str, str]] = None,
+    log_failure: bool = True
+) -> ServiceStatus:
     """
-    Check health of all downstream services.
-
-    Returns status of each configured microservice.
+    Probe a single downstream service.
+
+    Args:
+        client: HTTP client
+        name: Display name of the service
+        base_url: Service base URL (reported in the status)
+        path: Path to request relative to base_url
+        timeout: Request timeout in seconds
+        headers: Optional request headers
+        log_failure: Log an error if the probe fails
+
+    Returns:
+        ServiceStatus for the service (offline on any error)
     """
-    services = []
-
-    # Check Proxmox API
     try:
-        response = await client.get(
-            f"{settings.PROXMOX_API_URL}/version",
-            headers={"Authorization": settings.PROXMOX_API_TOKEN},
-            timeout=5.0
-        )
-        services.append(ServiceStatus(
-            name="Proxmox API",
-            url=settings.PROXMOX_API_URL,
+        response = await client.get(f"{base_url}{path}", headers=headers, timeout=timeout)
+        return ServiceStatus(
+            name=name,
+            url=base_url,
             status="online" if response.status_code == 200 else "offline",
             response_time_ms=response.elapsed.total_seconds() * 1000
-        ))
-    except Exception as e:
-        logger.error(f"Proxmox health check failed: {e}")
-        services.append(ServiceStatus(
-            name="Proxmox API",
-            url=settings.PROXMOX_API_URL,
-            status="offline"
-        ))
-
-    # Check File Service
-    try:
-        response = await client.get(
-            f"{settings.FILE_SERVICE_URL}/health",
-            timeout=5.0
         )
-        services.append(ServiceStatus(
-            name="File Service",
-            url=settings.FILE_SERVICE_URL,
-            status="online" if response.status_code == 200 else "offline",
-            response_time_ms=response.elapsed.total_seconds() * 1000
-        ))
     except Exception as e:
-        logger.error(f"File service health check failed: {e}")
-        services.append(ServiceStatus(
-            name="File Service",
-            url=settings.FILE_SERVICE_URL,
+        if log_failure:
+            logger.error(f"{name} health check failed: {e}")
+        return ServiceStatus(
+            name=name,
+            url=base_url,
             status="offline"
-        ))
-
-    # Check future services (will be offline for now)
-    future_services = [
-        ("StevenAI Service", settings.STEVENAI_SERVICE_URL),
-        ("Food101 Service", settings.FOOD101_SERVICE_URL),
-        ("Landsink Service", settings.LANDSINK_SERVICE_URL),
-    ]
-
-    for name, url in future_services:
-        try:
-            response = await client.get(f"{url}/health", timeout=2.0)
-            services.append(ServiceStatus(
-                name=name,
-                url=url,
-                status="online" if response.status_code == 200 else "offline",
-                response_time_ms=response.elapsed.total_seconds() * 1000
-            ))
-        except Exception:
-            services.append(ServiceStatus(
-                name=name,
-                url=url,
-                status="offline"
-            ))
+        )
+
+
+@router.get("/health/services", response_model=HealthResponse)
+async def get_services_status(client: HTTPClient):
+    """
+    Check health of all downstream services.
+
+    Returns status of each configured microservice. Services are probed
+    concurrently, so total latency is bounded by the slowest probe.
+    """
+    services = list(await asyncio.gather(
+        _probe(client, "Proxmox API", settings.PROXMOX_API_URL, "/version",
+               timeout=5.0, headers={"Authorization": settings.PROXMOX_API_TOKEN}),
+        _probe(client, "File Service", settings.FILE_SERVICE_URL, "/health", timeout=5.0),
+        # Future services (will be offline for now, so failures aren't logged)
+        _probe(client, "StevenAI Service", settings.STEVENAI_SERVICE_URL, "/health",
+               timeout=2.0, log_failure=False),
+        _probe(client, "Food101 Service", settings.FOOD101_SERVICE_URL, "/health",
+               timeout=2.0, log_failure=False),
+        _probe(client, "Landsink Service", settings.LANDSINK_SERVICE_URL, "/health",
+               timeout=2.0, log_failure=False),
+    ))
 
     # Determine overall health
     online_count = sum(1 for s in services if s.status == "online")
@@ -2,9 +2,11 @@
 Server statistics endpoints (Proxmox monitoring).
 """
 
+import hashlib
 import logging
 
-from fastapi import APIRouter, HTTPException, status
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from app.core.dependencies import HTTPClient
 from app.clients import proxmox_client
@@ -14,21 +16,33 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/stats", tags=["stats"])
 
+# Dashboards poll this endpoint; let them reuse a response briefly, then revalidate
+_STATS_CACHE_CONTROL = "max-age=2, must-revalidate"
+
 
 @router.get("/servers", response_model=ServerStatsResponse)
-async def get_server_stats(client: HTTPClient):
+async def get_server_stats(request: Request, client: HTTPClient):
     """
     Get server statistics from Proxmox.
 
     Returns CPU, memory, and temperature stats for all configured nodes.
+    Supports conditional GET: a matching If-None-Match gets 304 with no body.
     """
     try:
         nodes = await proxmox_client.get_server_stats(client)
 
-        return ServerStatsResponse(
+        body = orjson.dumps(ServerStatsResponse(
             success=True,
             nodes=nodes
-        )
+        ).model_dump())
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        headers = {"ETag": etag, "Cache-Control": _STATS_CACHE_CONTROL}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        return Response(content=body, media_type="application/json", headers=headers)
 
     except Exception as e:
         logger.error(f"Failed to get server stats: {e}")
@@ -2,101 +2,188 @@
 Proxmox API client for server monitoring.
 """
 
+import time
+import asyncio
 import logging
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 import httpx
-import psutil
+import orjson
 
 from app.core.config import settings
+from app.core.dependencies import read_cached_cpu_temp
 from shared_schemas.web_server import ServerNode
 
 logger = logging.getLogger(__name__)
 
 
+# Constant across requests, built once at import
+_PROXMOX_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": settings.PROXMOX_API_TOKEN
+}
+_STATUS_URL = settings.PROXMOX_API_URL + "/nodes/{}/status"
+_VERSION_URL = settings.PROXMOX_API_URL + "/version"
+_PROXMOX_TIMEOUT = httpx.Timeout(settings.PROXMOX_TIMEOUT)
+
+_INV_GIB = 1.0 / (1024 ** 3)  # bytes -> GiB multiplier
+
+# node_name -> (time.monotonic() when fetched, stats); offline results are
+# kept for PROXMOX_NEG_CACHE_TTL so an outage doesn't re-hit Proxmox per request
+_cache: Dict[str, Tuple[float, ServerNode]] = {}
+# node_name -> lock, so concurrent cache misses share one upstream request
+_locks: Dict[str, asyncio.Lock] = {}
+
+
+async def prewarm(client: httpx.AsyncClient):
+    """
+    Open the Proxmox connection ahead of the first /stats/servers request.
+
+    Issues a cheap /version call so the TLS handshake and HTTP/2 setup are
+    done at startup. Failures are logged and ignored.
+
+    Args:
+        client: HTTP client
+    """
+    try:
+        await client.get(_VERSION_URL, headers=_PROXMOX_HEADERS, timeout=_PROXMOX_TIMEOUT)
+        logger.info("Proxmox connection prewarmed")
+    except Exception as e:
+        logger.warning(f"Failed to prewarm Proxmox connection: {e}")
+
+
 async def get_server_stats(client: httpx.AsyncClient) -> List[ServerNode]:
     """
     Fetch server statistics from Proxmox API.
 
+    Nodes are fetched concurrently, so latency is that of the slowest node.
+
     Returns:
         List of ServerNode objects with stats for each node
     """
-    nodes = []
     node_names = ["local2"]
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": settings.PROXMOX_API_TOKEN
-    }
-
-    for node_name in node_names:
-        try:
-            # Fetch node status
-            response = await client.get(
-                f"{settings.PROXMOX_API_URL}/nodes/{node_name}/status",
-                headers=headers
-            )
-
-            if response.status_code == 200:
-                data = response.json().get("data", {})
-
-                # Extract memory stats
-                memory_info = data.get("memory", {})
-                memory_used = memory_info.get("used", 0)
-                memory_total = memory_info.get("total", 1)
-                memory_used_gb = memory_used / (1024 ** 3)  # Convert bytes to GB
-                memory_total_gb = memory_total / (1024 ** 3)
-                memory_usage_percent = (memory_used / memory_total) * 100 if memory_total > 0 else 0
-
-                # Extract CPU stats
-                cpu_info = data.get("cpu", 0)  # CPU usage as decimal (0.0 - 1.0)
-                cpuinfo = data.get("cpuinfo", {})
-                cpu_cores = cpuinfo.get("cpus", None)
-                cpu_usage_percent = cpu_info * 100  # Convert to percentage
-
-                # Get CPU temperature (only for local node using psutil)
-                cpu_temp = None
-                if node_name == "local":
-                    try:
-                        temps = psutil.sensors_temperatures()
-                        if temps and "coretemp" in temps:
-                            # Average temperature across all cores
-                            core_temps = [entry.current for entry in temps["coretemp"]]
-                            cpu_temp = sum(core_temps) / len(core_temps) if core_temps else None
-                    except Exception as e:
-                        logger.warning(f"Failed to get CPU temperature for {node_name}: {e}")
-
-                nodes.append(ServerNode(
-                    name=node_name,
-                    status="online",
-                    memory_used_gb=round(memory_used_gb, 2),
-                    memory_total_gb=round(memory_total_gb, 2),
-                    memory_usage_percent=round(memory_usage_percent, 2),
-                    cpu_usage_percent=round(cpu_usage_percent, 2),
-                    cpu_cores=cpu_cores,
-                    cpu_temp_celsius=round(cpu_temp, 2) if cpu_temp else None
-                ))
-
-                logger.info(f"Successfully fetched stats for node: {node_name}")
-
-            else:
-                logger.error(f"Failed to fetch stats for {node_name}: HTTP {response.status_code}")
-                nodes.append(ServerNode(
-                    name=node_name,
-                    status="offline"
-                ))
-
-        except httpx.RequestError as e:
-            logger.error(f"Request error fetching stats for {node_name}: {e}")
-            nodes.append(ServerNode(
-                name=node_name,
-                status="offline"
-            ))
-        except Exception as e:
-            logger.error(f"Unexpected error fetching stats for {node_name}: {e}")
-            nodes.append(ServerNode(
-                name=node_name,
-                status="offline"
-            ))
+    results = await asyncio.gather(
+        *(_get_node_stats(client, node_name) for node_name in node_names),
+        return_exceptions=True
+    )
+
+    nodes = []
+    for node_name, result in zip(node_names, results):
+        if isinstance(result, BaseException):
+            logger.error(f"Unexpected error fetching stats for {node_name}: {result}")
+            result = ServerNode(name=node_name, status="offline")
+        nodes.append(result)
 
     return nodes
+
+
+async def _get_node_stats(client: httpx.AsyncClient, node_name: str) -> ServerNode:
+    """
+    Get node stats, served from cache while younger than PROXMOX_CACHE_TTL
+    (PROXMOX_NEG_CACHE_TTL for offline results).
+
+    Callers that miss the cache at the same time wait on one upstream
+    request (single-flight) instead of each hitting Proxmox.
+
+    Args:
+        client: HTTP client
+        node_name: Proxmox node name
+
+    Returns:
+        ServerNode with the node's stats
+    """
+    node = _get_cached(node_name)
+    if node is not None:
+        return node
+
+    lock = _locks.get(node_name)
+    if lock is None:
+        lock = _locks[node_name] = asyncio.Lock()
+    async with lock:
+        # Another caller may have refreshed the entry while we waited
+        node = _get_cached(node_name)
+        if node is not None:
+            return node
+
+        node = await _fetch_node(client, node_name)
+        _cache[node_name] = (time.monotonic(), node)
+        return node
+
+
+def _get_cached(node_name: str) -> Optional[ServerNode]:
+    """Return the cached stats for a node if still fresh, else None."""
+    cached = _cache.get(node_name)
+    if cached is None:
+        return None
+
+    fetched_at, node = cached
+    ttl = settings.PROXMOX_CACHE_TTL if node.status == "online" else settings.PROXMOX_NEG_CACHE_TTL
+    return node if time.monotonic() - fetched_at < ttl else None
+
+
+async def _fetch_node(client: httpx.AsyncClient, node_name: str) -> ServerNode:
+    """
+    Fetch one node's status from the Proxmox API.
+
+    Args:
+        client: HTTP client
+        node_name: Proxmox node name
+
+    Returns:
+        ServerNode with the node's stats (status="offline" on any error)
+    """
+    try:
+        # Fetch node status; the raw body goes straight to orjson
+        async with client.stream(
+            "GET",
+            _STATUS_URL.format(node_name),
+            headers=_PROXMOX_HEADERS,
+            timeout=_PROXMOX_TIMEOUT
+        ) as response:
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch stats for {node_name}: HTTP {response.status_code}")
+                return ServerNode(name=node_name, status="offline")
+
+            data = orjson.loads(await response.aread()).get("data", {})
+
+        # Extract memory stats
+        memory_info = data.get("memory", {})
+        memory_used = memory_info.get("used", 0)
+        memory_total = memory_info.get("total", 1)
+        memory_used_gb = memory_used * _INV_GIB  # Convert bytes to GB
+        memory_total_gb = memory_total * _INV_GIB
+        memory_usage_percent = (memory_used / memory_total) * 100 if memory_total > 0 else 0
+
+        # Extract CPU stats
+        cpu_info = data.get("cpu", 0)  # CPU usage as decimal (0.0 - 1.0)
+        cpuinfo = data.get("cpuinfo", {})
+        cpu_cores = cpuinfo.get("cpus", None)
+        cpu_usage_percent = cpu_info * 100  # Convert to percentage
+
+        # Get CPU temperature (only for local node, sampled in the background)
+        cpu_temp = read_cached_cpu_temp() if node_name == "local" else None
+
+        logger.info(f"Successfully fetched stats for node: {node_name}")
+
+        # Every field is computed above, so skip pydantic validation
+        return ServerNode.model_construct(
+            name=node_name,
+            status="online",
+            memory_used_gb=round(memory_used_gb, 2),
+            memory_total_gb=round(memory_total_gb, 2),
+            memory_usage_percent=round(memory_usage_percent, 2),
+            cpu_usage_percent=round(cpu_usage_percent, 2),
+            cpu_cores=cpu_cores,
+            cpu_temp_celsius=round(cpu_temp, 2) if cpu_temp else None
+        )
+
+    except httpx.RequestError as e:
+        logger.error(f"Request error fetching stats for {node_name}: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected error fetching stats for {node_name}: {e}")
+
+    return ServerNode(
+        name=node_name,
+        status="offline"
+    )
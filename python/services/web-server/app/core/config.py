@@ -3,7 +3,9 @@ Configuration management for Web Server.
 Loads environment variables using Pydantic Settings.
 """
 
-from typing import List, Union
+from functools import lru_cache
+from typing import Tuple, Union
+
 from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
@@ -17,12 +19,19 @@ class Settings(BaseSettings):
     LOG_LEVEL: str
 
     # CORS Configuration
-    CORS_ORIGINS: Union[str, List[str]]
+    CORS_ORIGINS: Union[str, Tuple[str, ...]]
+    CORS_ALLOW_HEADERS: Union[str, Tuple[str, ...]] = (
+        "Authorization", "Content-Type", "X-Requested-With", "X-API-Key"
+    )
 
     # Proxmox API Configuration
     PROXMOX_API_URL: str
     PROXMOX_API_TOKEN: str  # Format: PVEAPIToken=root@pam!webserver=<token>
     PROXMOX_VERIFY_SSL: bool
+    PROXMOX_CACHE_TTL: float = 3.0  # Seconds node stats are served from cache
+    PROXMOX_NEG_CACHE_TTL: float = 10.0  # Seconds an offline result is served from cache
+    PROXMOX_TIMEOUT: float = 3.0  # Per-request timeout for Proxmox API calls
+    CPU_TEMP_SAMPLE_INTERVAL: float = 5.0  # Seconds between local CPU temperature samples
 
     # Downstream Microservices (for future use)
     STEVENAI_SERVICE_URL: str  # Future stevenai-service
@@ -35,18 +44,31 @@ class Settings(BaseSettings):
 
     @model_validator(mode="before")
     @classmethod
-    def parse_cors_origins(cls, values):
-        """Parse CORS_ORIGINS from comma-separated string to list."""
-        if isinstance(values.get("CORS_ORIGINS"), str):
-            values["CORS_ORIGINS"] = [
-                origin.strip() for origin in values["CORS_ORIGINS"].split(",")
-            ]
+    def parse_cors_lists(cls, values):
+        """Parse CORS_ORIGINS / CORS_ALLOW_HEADERS from comma-separated strings to tuples."""
+        for key in ("CORS_ORIGINS", "CORS_ALLOW_HEADERS"):
+            if isinstance(values.get(key), str):
+                values[key] = tuple(
+                    item.strip() for item in values[key].split(",")
+                )
         return values
 
     class Config:
         env_file = ".env"
         case_sensitive = True
+        frozen = True
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Load settings once per process.
+
+    Usable as a FastAPI dependency (Depends(get_settings)); every caller
+    shares the same immutable instance.
+    """
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -2,11 +2,13 @@
 Shared dependencies for FastAPI endpoints.
 """
 
+import asyncio
 import logging
-from typing import Annotated
+from typing import Annotated, Optional
 
 from fastapi import Depends
 import httpx
+import psutil
 
 from app.core.config import settings
 
@@ -21,13 +23,22 @@ async def get_http_client() -> httpx.AsyncClient:
     """
     Get or create the global HTTP client.
     Used for making requests to downstream services.
+
+    HTTP/2 lets concurrent gateway requests to the same upstream share one
+    multiplexed connection instead of opening a TCP+TLS connection each.
     """
     global _http_client
     if _http_client is None:
         _http_client = httpx.AsyncClient(
             timeout=30.0,
             follow_redirects=True,
-            verify=settings.PROXMOX_VERIFY_SSL
+            verify=settings.PROXMOX_VERIFY_SSL,
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=50,
+                max_connections=200,
+                keepalive_expiry=60.0
+            )
         )
     return _http_client
 
@@ -40,5 +51,54 @@ async def close_http_client():
         _http_client = None
 
 
+# CPU temperature sampler (keeps sensor reads off the request path)
+_cpu_temp_cache: Optional[float] = None
+_cpu_temp_task: Optional[asyncio.Task] = None
+
+
+def _read_cpu_temp() -> Optional[float]:
+    """Average coretemp reading across all cores, or None if unavailable."""
+    temps = psutil.sensors_temperatures()
+    if temps and "coretemp" in temps:
+        core_temps = [entry.current for entry in temps["coretemp"]]
+        return sum(core_temps) / len(core_temps) if core_temps else None
+    return None
+
+
+async def _sample_cpu_temp_loop():
+    """Background task refreshing the cached CPU temperature."""
+    global _cpu_temp_cache
+    while True:
+        try:
+            _cpu_temp_cache = _read_cpu_temp()
+        except Exception as e:
+            logger.warning(f"Failed to sample CPU temperature: {e}")
+        await asyncio.sleep(settings.CPU_TEMP_SAMPLE_INTERVAL)
+
+
+def start_cpu_temp_sampler():
+    """Start the background CPU temperature sampler."""
+    global _cpu_temp_task
+    if _cpu_temp_task is None:
+        _cpu_temp_task = asyncio.create_task(_sample_cpu_temp_loop())
+
+
+async def stop_cpu_temp_sampler():
+    """Stop the background CPU temperature sampler."""
+    global _cpu_temp_task
+    if _cpu_temp_task is not None:
+        _cpu_temp_task.cancel()
+        try:
+            await _cpu_temp_task
+        except asyncio.CancelledError:
+            pass
+        _cpu_temp_task = None
+
+
+def read_cached_cpu_temp() -> Optional[float]:
+    """Latest sampled average CPU temperature in Celsius, or None."""
+    return _cpu_temp_cache
+
+
 # Dependency annotation
 HTTPClient = Annotated[httpx.AsyncClient, Depends(get_http_client)]
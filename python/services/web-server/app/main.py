@@ -6,13 +6,20 @@ API Gateway that routes requests to specialized microservices.
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
-from app.core.dependencies import close_http_client
+from app.core.dependencies import (
+    close_http_client,
+    get_http_client,
+    start_cpu_temp_sampler,
+    stop_cpu_temp_sampler,
+)
 from app.api import health, stats, landsink, food, chat
+from app.clients import proxmox_client
 
 # Configure logging
 logging.basicConfig(
@@ -30,12 +37,16 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
-    logger.info("HTTP client will be initialized on first request")
+    client = await get_http_client()
+    logger.info("HTTP client initialized")
+    await proxmox_client.prewarm(client)
+    start_cpu_temp_sampler()
 
     yield
 
     # Shutdown
     logger.info("Shutting down Web Server...")
+    await stop_cpu_temp_sampler()
     await close_http_client()
     logger.info("HTTP client closed")
 
@@ -45,6 +56,7 @@ app = FastAPI(
     title=settings.APP_NAME,
     description="API Gateway for steven-universe microservices",
     version=settings.APP_VERSION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -55,7 +67,7 @@ app.add_middleware(
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=settings.CORS_ALLOW_HEADERS,
 )
 
 
@@ -67,44 +79,53 @@ app.include_router(food.router)
 app.include_router(chat.router)
 
 
-@app.get("/", tags=["root"])
-async def root():
-    """Root endpoint with service information."""
-    return {
-        "service": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "status": "running",
-        "endpoints": {
-            "health": {
-                "GET /health": "Service health check",
-                "GET /health/services": "Downstream services status"
-            },
-            "stats": {
-                "GET /stats/servers": "Proxmox server statistics"
-            },
-            "predictions": {
-                "GET /predictions/landsink?year=YYYY": "Climate prediction (Phase 4)"
-            },
-            "classifications": {
-                "POST /classifications/food": "Food image classification (Phase 3)"
-            },
-            "chat": {
-                "GET /chat/query?q=...&model=...&context=...": "AI chatbot query (Phase 2)"
-            }
+# Static root payload, serialized once
+_ROOT_BYTES = orjson.dumps({
+    "service": settings.APP_NAME,
+    "version": settings.APP_VERSION,
+    "status": "running",
+    "endpoints": {
+        "health": {
+            "GET /health": "Service health check",
+            "GET /health/services": "Downstream services status"
+        },
+        "stats": {
+            "GET /stats/servers": "Proxmox server statistics"
+        },
+        "predictions": {
+            "GET /predictions/landsink?year=YYYY": "Climate prediction (Phase 4)"
+        },
+        "classifications": {
+            "POST /classifications/food": "Food image classification (Phase 3)"
         },
-        "documentation": {
-            "swagger": "/docs",
-            "redoc": "/redoc",
-            "openapi": "/openapi.json"
+        "chat": {
+            "GET /chat/query?q=...&model=...&context=...": "AI chatbot query (Phase 2)"
         }
+    },
+    "documentation": {
+        "swagger": "/docs",
+        "redoc": "/redoc",
+        "openapi": "/openapi.json"
     }
+})
+
+
+@app.get("/", tags=["root"])
+async def root():
+    """Root endpoint with service information."""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler for unhandled errors."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    # Tracebacks only at DEBUG; %r keeps the exception type in INFO-level logs
+    logger.error(
+        "Unhandled exception: %r",
+        exc,
+        exc_info=logger.isEnabledFor(logging.DEBUG)
+    )
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -120,6 +141,8 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        loop="uvloop",
+        http="httptools",
         reload=True,
         log_level=settings.LOG_LEVEL.lower()
     )
@@ -6,36 +6,63 @@ Simulates loading and unloading a model from GPU memory.
 Emits structured JSON events that the GPU service parses.
 """
 
-import json
 import sys
-import time
+import asyncio
 import os
+import signal
+
+import orjson
+
+_out = sys.stdout.buffer
+
+
+def _encode_event(event_type: str, data: dict) -> bytes:
+    """
+    Encode one event as a JSON line.
+
+    Tags data in place rather than copying it into a new dict; callers
+    pass a fresh literal per event, so nothing else sees the mutation.
+    """
+    data["event"] = event_type
+    return orjson.dumps(data) + b"\n"
+
 
 def emit_event(event_type: str, data: dict):
     """Emit a structured JSON event to stdout."""
-    event = {"event": event_type, **data}
-    print(json.dumps(event), flush=True)
+    _out.write(_encode_event(event_type, data))
+    _out.flush()
+
+
+def emit_events(*events: tuple):
+    """Emit several (event_type, data) events back to back with a single flush."""
+    _out.writelines([_encode_event(event_type, data) for event_type, data in events])
+    _out.flush()
 
 
-def main():
+async def main():
+    # SIGTERM (docker stop) cancels the timeline so a final event is emitted
+    asyncio.get_running_loop().add_signal_handler(
+        signal.SIGTERM, asyncio.current_task().cancel
+    )
+
     # Get model info from environment
     model_name = os.environ.get("MODEL_NAME", "test-model")
     model_path = os.environ.get("MODEL_PATH", "/models")
 
     try:
-        # CONNECTION event
-        emit_event("connection", {
-            "status": "connected",
-            "worker": "loading-worker",
-            "model": model_name
-        })
-
-        # WORKER event - starting
-        emit_event("worker", {
-            "status": "initializing",
-            "message": "Initializing GPU..."
-        })
-        time.sleep(10)
+        # CONNECTION event, then WORKER event - starting
+        emit_events(
+            ("connection", {
+                "status": "connected",
+                "worker": "loading-worker",
+                "model": model_name
+            }),
+            ("worker", {
+                "status": "initializing",
+                "message": "Initializing GPU..."
+            })
+        )
+        await asyncio.sleep(10)
 
         # Simulate loading model into GPU memory
         emit_event("worker", {
@@ -45,33 +72,34 @@ def main():
 
         # Simulate loading time (5 seconds)
         for i in range(1, 6):
-            time.sleep(3)
+            await asyncio.sleep(3)
             emit_event("text_delta", {
                 "delta": f"Loading progress: {i * 20}%\n"
             })
 
-        # Model loaded
-        emit_event("worker", {
-            "status": "ready",
-            "message": "Model loaded successfully"
-        })
-
-        # Simulate some GPU computation
-        emit_event("text_delta", {
-            "delta": "\nPerforming GPU computation...\n"
-        })
-        time.sleep(2)
-
-        emit_event("text", {
-            "content": f"Model {model_name} computation complete!\nGPU memory allocated: ~2GB\n"
-        })
-
-        # Simulate unloading model
-        emit_event("worker", {
-            "status": "cleaning_up",
-            "message": "Unloading model from GPU..."
-        })
-        time.sleep(1)
+        # Model loaded, simulate some GPU computation
+        emit_events(
+            ("worker", {
+                "status": "ready",
+                "message": "Model loaded successfully"
+            }),
+            ("text_delta", {
+                "delta": "\nPerforming GPU computation...\n"
+            })
+        )
+        await asyncio.sleep(2)
+
+        # Result, then simulate unloading model
+        emit_events(
+            ("text", {
+                "content": f"Model {model_name} computation complete!\nGPU memory allocated: ~2GB\n"
+            }),
+            ("worker", {
+                "status": "cleaning_up",
+                "message": "Unloading model from GPU..."
+            })
+        )
+        await asyncio.sleep(1)
 
         emit_event("text_delta", {
             "delta": "GPU memory freed.\n"
@@ -83,6 +111,13 @@ def main():
             "message": "Worker completed successfully"
         })
 
+    except asyncio.CancelledError:
+        emit_event("finish", {
+            "status": "cancelled",
+            "error": "Worker terminated"
+        })
+        sys.exit(128 + signal.SIGTERM)
+
     except Exception as e:
         # Error event
         emit_event("finish", {
@@ -93,4 +128,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())